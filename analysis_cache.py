@@ -0,0 +1,73 @@
+"""Process-wide memo of analysis, score and breach results
+
+Entries are keyed by a keyed BLAKE2b hash of the password under a random
+per-process salt, so plaintext passwords are never kept as cache keys and the
+keys cannot be matched against a precomputed table. Breach counts live in a
+separate cache with their own, shorter TTL so they refresh independently of
+the local analysis.
+"""
+import os
+from hashlib import blake2b
+
+import scoring_policy
+from password_analysis import local_password_analysis
+from ttl_cache import TTLCache
+
+CACHE_SIZE = int(os.environ.get("ANALYSIS_CACHE_SIZE", "1024"))
+CACHE_TTL = float(os.environ.get("ANALYSIS_CACHE_TTL", "3600"))
+BREACH_TTL = float(os.environ.get("BREACH_RESULT_TTL", "600"))
+
+_salt = os.urandom(16)
+
+# Cached values are shared between sessions: treat them as read-only
+analysis_cache = TTLCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
+breach_cache = TTLCache(maxsize=CACHE_SIZE, ttl=BREACH_TTL)
+
+
+def password_key(password):
+    """Salted 128-bit hash of password used as the cache key"""
+    return blake2b(password.encode('utf-8', errors='surrogatepass'), key=_salt,
+                   digest_size=16).digest()
+
+
+def analyze_and_score(password, analyze=local_password_analysis):
+    """Return (analysis, score, rating, color) for password, memoized
+
+    analyze computes the analysis on a miss, e.g. an IncrementalAnalysis.update.
+    Cached scores are recomputed after the scoring policy is reloaded.
+    """
+    key = password_key(password)
+    policy = scoring_policy.get_policy()
+    entry = analysis_cache.get(key)
+    if entry is None:
+        entry = (analyze(password), None, None)
+    if entry[1] != policy.version:
+        # New entry, or the scoring policy was reloaded since it was scored
+        entry = (entry[0], policy.version, policy.score(entry[0]))
+        analysis_cache.set(key, entry)
+    return (entry[0],) + tuple(entry[2])
+
+
+def breach_count(password, lookup):
+    """Return lookup(password), memoized for BREACH_TTL seconds
+
+    A None result (breach check unavailable) is not cached, so the next call
+    tries again.
+    """
+    key = password_key(password)
+    count = breach_cache.get(key)
+    if count is None:
+        count = lookup(password)
+        if count is not None:
+            breach_cache.set(key, count)
+    return count
+
+
+def clear():
+    analysis_cache.clear()
+    breach_cache.clear()
+
+
+def stats():
+    """Hit/miss statistics of the analysis and breach caches"""
+    return {'analysis': analysis_cache.stats(), 'breach': breach_cache.stats()}
@@ -0,0 +1,206 @@
+"""Vectorized analysis and scoring of many passwords at once (requires NumPy)
+
+Passwords are packed into a fixed-width UCS4 code-point matrix, one row per
+password, and every check in password_analysis is evaluated column-wise.
+Rows containing non-ASCII characters, and rows longer than MAX_WIDTH, fall
+back to the scalar scanner so results match local_password_analysis exactly
+and one junk line cannot widen the matrix for the whole batch.
+"""
+import common_passwords
+import scoring_policy
+import sequence_matcher
+from guess_estimator import estimate_guesses
+from password_analysis import (
+    FEEDBACK_MIN_LENGTH,
+    FEEDBACK_RATINGS,
+    SPECIAL_CHARS,
+    feedback_bundles,
+    scan_characters,
+)
+
+try:
+    import numpy as np
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+# Widest row packed into the matrix; longer passwords take the scalar path
+MAX_WIDTH = 256
+
+
+def _require_numpy():
+    if not numpy_available:
+        raise ImportError("analyze_batch requires NumPy: pip install numpy")
+
+
+def _pack(passwords):
+    """Return (code-point matrix, lengths, rows too long to pack) for a list of passwords
+
+    Rows longer than MAX_WIDTH are packed as empty strings and must be
+    analyzed by the caller.
+    """
+    lengths = np.fromiter((len(p) for p in passwords), dtype=np.int64, count=len(passwords))
+    long_rows = np.flatnonzero(lengths > MAX_WIDTH)
+    if long_rows.size:
+        passwords = [p if len(p) <= MAX_WIDTH else '' for p in passwords]
+    width = max(int(np.minimum(lengths, MAX_WIDTH).max(initial=0)), 1)
+    codes = np.array(passwords, dtype=f"<U{width}").view(np.uint32)
+    return codes.reshape(len(passwords), width), lengths, long_rows
+
+
+def _max_runs(codes, lengths):
+    """Longest run of identical characters per row, ignoring newlines and padding"""
+    rows, width = codes.shape
+    flat = codes.ravel()
+    valid = (np.arange(width) < lengths[:, None]).ravel() & (flat != 10)
+    starts = np.ones(flat.size, dtype=bool)
+    starts[1:] = flat[1:] != flat[:-1]
+    starts[::width] = True
+    run_ids = np.cumsum(starts) - 1
+    run_lengths = np.bincount(run_ids, weights=valid, minlength=run_ids[-1] + 1 if flat.size else 0)
+    run_rows = np.flatnonzero(starts) // width
+    max_run = np.zeros(rows, dtype=np.int64)
+    np.maximum.at(max_run, run_rows, run_lengths.astype(np.int64))
+    return max_run
+
+
+def _window_keys(codes):
+    """Pack each MIN_LENGTH-wide window of 7-bit codes into one integer"""
+    n = sequence_matcher.MIN_LENGTH
+    width = codes.shape[1]
+    keys = np.zeros((codes.shape[0], max(width - n + 1, 0)), dtype=np.int64)
+    for k in range(n):
+        keys = (keys << 7) | (codes[:, k:width - n + 1 + k] & 0x7F)
+    return keys
+
+
+_sequence_keys = None
+
+
+def _contains_sequence(lowered, lengths):
+    """True for ASCII rows containing any keyboard-walk or run pattern
+
+    Every pattern of the matcher starts with a MIN_LENGTH pattern, so testing
+    each window against that set is equivalent to running the automaton.
+    """
+    global _sequence_keys
+    if _sequence_keys is None:
+        windows = sequence_matcher.min_length_windows()
+        _sequence_keys = np.sort(_window_keys(
+            np.array([[ord(c) for c in w] for w in windows], dtype=np.int64)).ravel())
+    n = sequence_matcher.MIN_LENGTH
+    keys = _window_keys(lowered.astype(np.int64))
+    hit = np.isin(keys, _sequence_keys)
+    # A window must lie inside the password, not in the zero padding
+    hit &= np.arange(n, lowered.shape[1] + 1) <= lengths[:, None]
+    return hit.any(axis=1)
+
+
+def analyze_batch(passwords, guesses=False):
+    """Analyze a list of passwords; returns a dict of NumPy arrays, one entry per password
+
+    Keys match local_password_analysis except 'sequence_spans'; 'common_rank'
+    is 0 where the password is not in the common-password list. The guess
+    estimate has no vectorized form and runs per password, making the batch
+    10-30x slower, so it is only added with guesses=True.
+    """
+    _require_numpy()
+    passwords = list(passwords)
+    codes, lengths, long_rows = _pack(passwords)
+
+    is_upper = (codes >= 65) & (codes <= 90)
+    is_lower = (codes >= 97) & (codes <= 122)
+    is_digit = (codes >= 48) & (codes <= 57)
+    special_table = np.zeros(128, dtype=bool)
+    special_table[[ord(c) for c in SPECIAL_CHARS]] = True
+    is_special = special_table[np.minimum(codes, 127)] & (codes < 128)
+
+    analysis = {
+        'length': lengths,
+        'upper_count': is_upper.sum(axis=1),
+        'lower_count': is_lower.sum(axis=1),
+        'digit_count': is_digit.sum(axis=1),
+        'special_count': is_special.sum(axis=1),
+        'max_run': _max_runs(codes, lengths),
+    }
+
+    # str.lower() only maps A-Z on ASCII rows; other rows are redone below
+    lowered = np.where(is_upper, codes | 32, codes)
+    analysis['sequences'] = _contains_sequence(lowered, lengths)
+
+    scalar_rows = np.union1d(np.flatnonzero((codes > 127).any(axis=1)), long_rows)
+    for i in scalar_rows.tolist():
+        password = passwords[i]
+        counts = scan_characters(password)
+        for key, value in counts.items():
+            analysis[key][i] = value
+        analysis['sequences'][i] = sequence_matcher.get_default_matcher().search(password.lower())
+
+    wordlist = common_passwords.get_default_list()
+    analysis['common_rank'] = np.fromiter(
+        (wordlist.rank(p) or 0 for p in passwords), dtype=np.int64, count=len(passwords))
+
+    analysis['uppercase'] = analysis['upper_count'] > 0
+    analysis['lowercase'] = analysis['lower_count'] > 0
+    analysis['digit'] = analysis['digit_count'] > 0
+    analysis['special'] = analysis['special_count'] > 0
+    analysis['repeating'] = analysis['max_run'] >= 3
+    analysis['common'] = analysis['common_rank'] > 0
+
+    if guesses:
+        estimates = [estimate_guesses(p) for p in passwords]
+        analysis['guesses_log10'] = np.array([e['guesses_log10'] for e in estimates], dtype=np.float64)
+        analysis['guess_score'] = np.array([e['guess_score'] for e in estimates], dtype=np.int64)
+    return analysis
+
+
+def _feature_masks(analysis):
+    mask = np.zeros(len(analysis['length']), dtype=np.int64)
+    for bit, name in enumerate(scoring_policy.FEATURES):
+        mask |= analysis[name].astype(np.int64) << bit
+    return mask
+
+
+def score_batch(analysis, policy=None):
+    """Vectorized calculate_score_and_rating; returns (scores, ratings, colors) arrays
+
+    Reads the same compiled table as the scalar path, one gather per column.
+    """
+    _require_numpy()
+    policy = policy or scoring_policy.get_policy()
+    _, scores, levels, ratings, colors, _ = policy.arrays(np)
+    index = _policy_index(analysis, policy)
+    level = levels[index]
+    return scores[index], ratings[level], colors[level]
+
+
+def _policy_index(analysis, policy):
+    bounds = policy.arrays(np)[0]
+    length = analysis['length']
+    bucket = np.searchsorted(bounds, length, side='right') - 1
+    guess = np.full(len(length), policy.guess_rows - 1, dtype=np.int64)
+    if 'guess_score' in analysis and policy.guess_score_caps:
+        guess = np.minimum(analysis['guess_score'], policy.guess_rows - 2)
+    return ((bucket * policy.guess_rows + guess) << len(scoring_policy.FEATURES)) | _feature_masks(analysis)
+
+
+def feedback_batch(analysis, ratings, policy=None):
+    """Vectorized generate_improvement_feedback; returns a list of shared feedback tuples"""
+    _require_numpy()
+    policy = policy or scoring_policy.get_policy()
+    capped = policy.arrays(np)[5][_policy_index(analysis, policy)].astype(np.int64)
+    needs_tips = np.isin(ratings, FEEDBACK_RATINGS).astype(np.int64)
+    length = np.minimum(analysis['length'], FEEDBACK_MIN_LENGTH)
+    row = (capped * 2 + needs_tips) * (FEEDBACK_MIN_LENGTH + 1) + length
+    index = (row << len(scoring_policy.FEATURES)) | _feature_masks(analysis)
+    bundles = feedback_bundles()
+    return [bundles[i] for i in index.tolist()]
+
+
+def iter_rows(analysis):
+    """Yield per-password analysis dicts (with Python scalars) from analyze_batch output"""
+    columns = {key: value.tolist() for key, value in analysis.items()}
+    for i in range(len(columns['length'])):
+        row = {key: values[i] for key, values in columns.items()}
+        row['common_rank'] = row['common_rank'] or None
+        yield row
@@ -0,0 +1,85 @@
+"""Check audit memory on input with pathologically long lines
+
+    python benchmarks/bench_audit_memory.py --budget-mib 400
+
+Writes a synthetic password file with a few junk lines of up to --long-length
+characters in the middle, audits it with each engine in a fresh interpreter,
+and reports the peak resident memory. Exits with status 1 if any engine goes
+over the budget, fails, or writes a report different from the python engine's.
+Peak memory is read with the resource module, so this runs on Unix only.
+"""
+import argparse
+import os
+import random
+import string
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+_PROBE = ("import resource, sys, pwcheck; "
+          "status = pwcheck.main(['audit', {path!r}, '-o', {out!r}, '--engine', {engine!r}]); "
+          "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss); sys.exit(status)")
+
+
+def make_password_file(path, count, long_length, seed=1):
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            f.write("".join(rng.choices(alphabet, k=rng.randint(6, 20))) + "\n")
+            if i == count // 2:
+                f.write("x" * (long_length // 5) + "\n")
+                f.write("".join(rng.choices(alphabet, k=long_length)) + "\n")
+
+
+def measure(engine, path, out):
+    """Return the peak resident memory in MiB of one audit, or None if it failed"""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(path=path, out=out, engine=engine)],
+        cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    peak = int(result.stdout.split()[-1])
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--passwords", type=int, default=10000)
+    parser.add_argument("--long-length", type=int, default=100000)
+    parser.add_argument("--budget-mib", type=float, default=400.0)
+    parser.add_argument("--engines", nargs="+", default=["python", "numpy", "auto"])
+    args = parser.parse_args(argv)
+
+    status = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "passwords.txt")
+        make_password_file(path, args.passwords, args.long_length)
+        reports = {}
+        print(f"{'engine':<8} {'peak MiB':>9}  (budget {args.budget_mib:.0f} MiB)")
+        for engine in args.engines:
+            out = os.path.join(tmp, f"report-{engine}.csv")
+            peak = measure(engine, path, out)
+            if peak is None:
+                print(f"{engine:<8} {'failed':>9}")
+                status = 1
+                continue
+            print(f"{engine:<8} {peak:>9.1f}")
+            if peak > args.budget_mib:
+                print(f"FAIL: {engine} over budget")
+                status = 1
+            with open(out, "rb") as f:
+                reports[engine] = f.read()
+        expected = reports.get("python")
+        for engine, report in reports.items():
+            if expected is not None and report != expected:
+                print(f"FAIL: {engine} report differs from the python engine")
+                status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
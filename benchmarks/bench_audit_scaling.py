@@ -0,0 +1,82 @@
+"""Measure audit throughput as the worker count grows
+
+    python benchmarks/bench_audit_scaling.py --passwords 500000
+
+Runs the same synthetic password file through pwcheck.run_audit with
+1, 2, 4, ... workers up to the CPU count and prints the speed-up over one
+worker. Output is discarded so only analysis and formatting are measured.
+"""
+import argparse
+import io
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pwcheck  # noqa: E402
+
+
+class _Discard(io.TextIOBase):
+    def write(self, text):
+        return len(text)
+
+
+class _Quiet:
+    count = 0
+
+    def update(self, n):
+        self.count += n
+
+    def report(self, final=True):
+        pass
+
+
+def make_password_file(path, count, seed=1):
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(count):
+            f.write("".join(rng.choices(alphabet, k=rng.randint(6, 20))) + "\n")
+
+
+def worker_counts(limit):
+    counts, n = [], 1
+    while n < limit:
+        counts.append(n)
+        n *= 2
+    return counts + [limit]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--passwords", type=int, default=500000)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--engine", choices=("auto", "numpy", "python"), default="auto")
+    parser.add_argument("--guesses", action="store_true", help="include the guess estimate")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "passwords.txt")
+        make_password_file(path, args.passwords)
+        baseline = None
+        print(f"{'workers':>7} {'seconds':>8} {'passwords/s':>12} {'speed-up':>8}")
+        for workers in worker_counts(args.max_workers):
+            with open(path, "rb") as source:
+                start = time.perf_counter()
+                pwcheck.run_audit(source, _Discard(), chunk_size=args.chunk_size,
+                                  engine=args.engine, progress=_Quiet(), workers=workers,
+                                  guesses=args.guesses)
+                elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{workers:>7} {elapsed:>8.2f} {args.passwords / elapsed:>12,.0f} "
+                  f"{baseline / elapsed:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""Check the import time of the headless engine against a budget
+
+    python benchmarks/bench_import_time.py --budget-ms 20
+
+Imports password_engine in fresh interpreters (-X importtime), reports the
+median cumulative import time and the slowest modules it pulls in, and exits
+with status 1 if the median exceeds the budget or if a heavy dependency
+(streamlit, requests, numpy, pyperclip) is imported eagerly.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+HEAVY_MODULES = ("streamlit", "requests", "numpy", "pyperclip")
+
+_PROBE = "import sys, {module}; print(','.join(m for m in {heavy!r} if m in sys.modules))"
+
+
+def measure(module):
+    """Return ({module: cumulative microseconds}, eagerly imported heavy modules)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=ROOT, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative_us)
+    heavy = [m for m in result.stdout.strip().split(",") if m]
+    return times, heavy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--budget-ms", type=float, default=20.0)
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    totals, times, heavy = [], {}, []
+    for _ in range(args.runs):
+        times, heavy = measure("password_engine")
+        totals.append(times["password_engine"] / 1000)
+    median = statistics.median(totals)
+
+    print(f"password_engine import: median {median:.1f} ms over {args.runs} runs "
+          f"(budget {args.budget_ms:.0f} ms)")
+    local = {name: us for name, us in times.items()
+             if os.path.exists(os.path.join(ROOT, name + ".py")) and name != "password_engine"}
+    for name, us in sorted(local.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<24} {us / 1000:>6.1f} ms")
+
+    status = 0
+    if heavy:
+        print(f"FAIL: imported eagerly: {', '.join(heavy)}")
+        status = 1
+    if median > args.budget_ms:
+        print("FAIL: over budget")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
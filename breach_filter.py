@@ -0,0 +1,131 @@
+"""Bloom filter over breached SHA-1 digests for fast "definitely not breached" answers"""
+import math
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b"PWNBLOOM"
+HEADER = struct.Struct("<8sQQI")
+
+# Path of the filter consulted before the exact index or the API
+FILTER_PATH = os.environ.get("PWNED_FILTER_PATH", "pwned_filter.bin")
+
+_default_filter = None
+_default_loaded = False
+
+
+def optimal_parameters(n, fpr):
+    """Return (bits, hash count) for n keys at the target false-positive rate"""
+    n = max(n, 1)
+    bits = math.ceil(-n * math.log(fpr) / (math.log(2) ** 2))
+    bits = (bits + 7) // 8 * 8
+    hashes = max(1, round(bits / n * math.log(2)))
+    return bits, hashes
+
+
+def _positions(digest, bits, hashes):
+    # SHA-1 output is already uniform, so double hashing on two 64-bit
+    # slices of the digest replaces k independent hash functions.
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:16], "little") | 1
+    return [(h1 + i * h2) % bits for i in range(hashes)]
+
+
+class BreachFilter:
+    """Bit array plus hash count; supports `digest in filter`"""
+
+    def __init__(self, bits, hashes, count, data):
+        self.bits = bits
+        self.hashes = hashes
+        self.count = count
+        self._data = data
+
+    @classmethod
+    def create(cls, n, fpr=0.001):
+        bits, hashes = optimal_parameters(n, fpr)
+        return cls(bits, hashes, 0, bytearray(bits // 8))
+
+    @classmethod
+    def load(cls, path):
+        """Memory-map a serialized filter; pages are shared between processes"""
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, bits, count, hashes = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC:
+            mm.close()
+            raise ValueError(f"{path} is not a breach filter file")
+        if HEADER.size + bits // 8 > len(mm):
+            mm.close()
+            raise ValueError(f"{path} is truncated")
+        return cls(bits, hashes, count, memoryview(mm)[HEADER.size:HEADER.size + bits // 8])
+
+    def add(self, digest):
+        data = self._data
+        for pos in _positions(digest, self.bits, self.hashes):
+            data[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, digest):
+        data = self._data
+        for pos in _positions(digest, self.bits, self.hashes):
+            if not data[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    @property
+    def memory_bytes(self):
+        return self.bits // 8
+
+    @property
+    def false_positive_rate(self):
+        """Expected false-positive rate for the number of keys added"""
+        return (1 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes
+
+    def save(self, dest):
+        tmp = dest + ".tmp"
+        with open(tmp, "wb") as out:
+            out.write(HEADER.pack(MAGIC, self.bits, self.count, self.hashes))
+            out.write(self._data)
+        os.replace(tmp, dest)
+
+
+def get_default_filter():
+    """Load the filter at FILTER_PATH once per process, or return None if absent"""
+    global _default_filter, _default_loaded
+    if not _default_loaded:
+        _default_loaded = True
+        if FILTER_PATH and os.path.exists(FILTER_PATH):
+            _default_filter = BreachFilter.load(FILTER_PATH)
+    return _default_filter
+
+
+def build_filter(index, fpr=0.001):
+    """Build a filter holding every digest in a BreachIndex"""
+    bloom = BreachFilter.create(len(index), fpr)
+    for digest, _ in index:
+        bloom.add(digest)
+    return bloom
+
+
+def main(argv=None):
+    import argparse
+
+    import breach_index
+
+    parser = argparse.ArgumentParser(description="Build a Bloom filter from a breach index")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("index", help="index written by breach_index.py build")
+    parser.add_argument("dest", help="output filter file")
+    parser.add_argument("--fpr", type=float, default=0.001, help="target false-positive rate")
+    args = parser.parse_args(argv)
+
+    bloom = build_filter(breach_index.BreachIndex(args.index), args.fpr)
+    bloom.save(args.dest)
+    print(f"Wrote {bloom.count} hashes to {args.dest}: {bloom.memory_bytes / 2**20:.1f} MiB, "
+          f"{bloom.hashes} hashes, expected FPR {bloom.false_positive_rate:.4%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
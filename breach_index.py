@@ -0,0 +1,152 @@
+"""Offline Pwned Passwords index: sorted SHA-1 digests in a memory-mapped file"""
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b"PWNDIDX1"
+HEADER = struct.Struct("<8sQ")
+RECORD = struct.Struct("<20sI")
+DIGEST_SIZE = 20
+
+# Index used by check_breached_password; defaults to pwned_index.bin in the
+# working directory, and lookups use the live API when the file is missing
+# (set PWNED_INDEX_PATH to an empty string to always use the live API)
+INDEX_PATH = os.environ.get("PWNED_INDEX_PATH", "pwned_index.bin")
+
+_default_index = None
+_default_loaded = False
+
+
+class BreachIndex:
+    """Read-only view of a breach index file, shared through the OS page cache"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a breach index file")
+        if HEADER.size + self.count * RECORD.size > len(self._mm):
+            self._mm.close()
+            raise ValueError(f"{path} is truncated")
+        if hasattr(self._mm, "madvise"):
+            self._mm.madvise(mmap.MADV_RANDOM)
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self._mm.close()
+
+    def __iter__(self):
+        """Yield (digest, count) records in hash order"""
+        end = HEADER.size + self.count * RECORD.size
+        with memoryview(self._mm)[HEADER.size:end] as view:
+            yield from RECORD.iter_unpack(view)
+
+    def _digest_at(self, i):
+        start = HEADER.size + i * RECORD.size
+        return self._mm[start:start + DIGEST_SIZE]
+
+    def lookup(self, digest):
+        """Return the breach count for a raw 20-byte SHA-1 digest (0 if absent)"""
+        lo, hi = 0, self.count - 1
+        if hi < 0:
+            return 0
+        key = int.from_bytes(digest[:8], "big")
+        lo_key = int.from_bytes(self._digest_at(lo)[:8], "big")
+        hi_key = int.from_bytes(self._digest_at(hi)[:8], "big")
+        # Interpolation search: SHA-1 digests are uniformly distributed, so
+        # the first probe usually lands within a page of the target.
+        while lo <= hi and lo_key <= key <= hi_key:
+            if hi_key == lo_key:
+                mid = lo
+            else:
+                mid = lo + (key - lo_key) * (hi - lo) // (hi_key - lo_key)
+            probe = self._digest_at(mid)
+            if probe == digest:
+                return RECORD.unpack_from(self._mm, HEADER.size + mid * RECORD.size)[1]
+            if probe < digest:
+                lo = mid + 1
+                if lo <= hi:
+                    lo_key = int.from_bytes(self._digest_at(lo)[:8], "big")
+            else:
+                hi = mid - 1
+                if lo <= hi:
+                    hi_key = int.from_bytes(self._digest_at(hi)[:8], "big")
+            if hi - lo < 64:
+                break
+        # Finish the narrowed range with a plain binary search
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            probe = self._digest_at(mid)
+            if probe == digest:
+                return RECORD.unpack_from(self._mm, HEADER.size + mid * RECORD.size)[1]
+            if probe < digest:
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        return 0
+
+    def lookup_hex(self, sha1_hex):
+        """Return the breach count for a 40-character hex SHA-1 digest"""
+        return self.lookup(bytes.fromhex(sha1_hex))
+
+
+def get_default_index():
+    """Open the index at INDEX_PATH once per process, or return None if absent"""
+    global _default_index, _default_loaded
+    if not _default_loaded:
+        _default_loaded = True
+        if INDEX_PATH and os.path.exists(INDEX_PATH):
+            _default_index = BreachIndex(INDEX_PATH)
+    return _default_index
+
+
+def iter_dump_records(lines):
+    """Parse 'HASH:COUNT' lines from the Pwned Passwords SHA-1 dump"""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        digest, _, count = line.partition(":")
+        yield bytes.fromhex(digest), int(count or 0)
+
+
+def build_index(records, dest):
+    """Write sorted (digest, count) records to dest and return the record count"""
+    tmp = dest + ".tmp"
+    count = 0
+    previous = b""
+    with open(tmp, "wb") as out:
+        out.write(HEADER.pack(MAGIC, 0))
+        for digest, n in records:
+            if len(digest) != DIGEST_SIZE:
+                raise ValueError(f"record {count}: expected a 20-byte SHA-1 digest")
+            if digest <= previous:
+                raise ValueError(f"record {count}: input must be sorted by hash without duplicates")
+            out.write(RECORD.pack(digest, min(n, 0xFFFFFFFF)))
+            previous = digest
+            count += 1
+        out.seek(0)
+        out.write(HEADER.pack(MAGIC, count))
+    os.replace(tmp, dest)
+    return count
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 3 or argv[0] != "build":
+        print("usage: python breach_index.py build pwned-passwords-sha1-ordered-by-hash.txt pwned_index.bin")
+        return 2
+    with open(argv[1], "r", encoding="ascii") as src:
+        count = build_index(iter_dump_records(src), argv[2])
+    print(f"Wrote {count} hashes to {argv[2]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""Bulk password generation for onboarding and reset campaigns
+
+Passwords are generated in fixed-size blocks, optionally across a pool of
+worker processes. Each worker draws from its own entropy pool (buffers are
+discarded on fork, so no two processes share a byte stream). The parent
+streams blocks out in order and enforces uniqueness within the batch.
+Uniqueness uses a set of keyed 64-bit hashes, or a Bloom filter once the
+batch is too large for that. A password that matches the set or filter is
+replaced, so false positives only cost a redraw and duplicates never get
+through.
+"""
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
+
+import entropy_pool
+from breach_filter import BreachFilter
+from password_generator import generate_password, password_entropy
+
+# Above this many passwords the uniqueness check switches to a Bloom filter
+BLOOM_THRESHOLD = 1_000_000
+BLOOM_FPR = 1e-6
+
+# Consecutive repeats after which the constraints are treated as exhausted
+MAX_REDRAWS = 1000
+
+
+class UniquePasswords:
+    """Membership check for passwords already issued in this batch
+
+    'hash' keeps a set of 64-bit keyed hashes (exact up to hash collisions);
+    'bloom' keeps a Bloom filter sized for expected entries at BLOOM_FPR.
+    Either way add() never accepts a repeated password.
+    """
+
+    def __init__(self, expected=0, mode='auto'):
+        if mode == 'auto':
+            mode = 'bloom' if expected > BLOOM_THRESHOLD else 'hash'
+        if mode not in ('hash', 'bloom'):
+            raise ValueError(f"unknown uniqueness mode {mode!r}")
+        if mode == 'bloom' and expected <= 0:
+            raise ValueError("a Bloom filter needs the expected number of passwords")
+        self.mode = mode
+        self._key = os.urandom(16)
+        self._hashes = set() if mode == 'hash' else None
+        self._bloom = BreachFilter.create(max(expected, 1), BLOOM_FPR) if mode == 'bloom' else None
+        self.rejected = 0
+        self.count = 0
+
+    def add(self, password):
+        """Record password; returns False if it (may) have been issued already"""
+        digest = blake2b(password.encode('utf-8'), key=self._key, digest_size=16).digest()
+        if self._bloom is not None:
+            if digest in self._bloom:
+                self.rejected += 1
+                return False
+            self._bloom.add(digest)
+            self.count += 1
+            return True
+        key = int.from_bytes(digest[:8], 'little')
+        if key in self._hashes:
+            self.rejected += 1
+            return False
+        self._hashes.add(key)
+        self.count += 1
+        return True
+
+    @property
+    def memory_bytes(self):
+        if self._bloom is not None:
+            return self._bloom.memory_bytes
+        # Roughly one 8-byte int object plus a set slot per entry
+        return len(self._hashes) * 48
+
+
+def generate_block(count, length=16, classes=None, minimums=None):
+    """Worker entry point: generate count passwords from this process's pool"""
+    rng = entropy_pool.get_default_pool()
+    return [generate_password(length, classes, minimums, rng) for _ in range(count)]
+
+
+def _block_sizes(count, chunk_size):
+    if count is None:
+        while True:
+            yield chunk_size
+    while count > 0:
+        yield min(count, chunk_size)
+        count -= chunk_size
+
+
+def iter_blocks(count, length=16, classes=None, minimums=None, workers=1, chunk_size=10000):
+    """Yield lists of generated passwords, in order; count None means no end"""
+    sizes = _block_sizes(count, chunk_size)
+    if workers <= 1:
+        for size in sizes:
+            yield generate_block(size, length, classes, minimums)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        try:
+            for size in sizes:
+                pending.append(pool.submit(generate_block, size, length, classes, minimums))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def iter_unique_passwords(count=None, length=16, classes=None, minimums=None, workers=1,
+                          chunk_size=10000, unique='auto', expected=None):
+    """Yield count passwords (endlessly if None), none repeated within the batch
+
+    expected sizes the uniqueness filter when count is None. Raises
+    ValueError up front when the constraints allow too few distinct
+    passwords for count of them, and while iterating when MAX_REDRAWS
+    draws in a row repeat earlier passwords (a batch of unknown size that
+    has used up the constraints).
+    """
+    size = count if count is not None else expected
+    if size and math.log2(size) > password_entropy(length, classes, minimums) - 1:
+        raise ValueError(f"length {length} and these character classes allow too few "
+                         f"distinct passwords for {size:,} unique ones")
+    seen = UniquePasswords(size or 0, unique)
+    return _unique_passwords(seen, count, length, classes, minimums, workers, chunk_size)
+
+
+def _unique_passwords(seen, count, length, classes, minimums, workers, chunk_size):
+    rng = entropy_pool.get_default_pool()
+    for block in iter_blocks(count, length, classes, minimums, workers, chunk_size):
+        for password in block:
+            redraws = 0
+            while not seen.add(password):
+                redraws += 1
+                if redraws > MAX_REDRAWS:
+                    raise ValueError(f"length {length} and these character classes ran out of "
+                                     f"distinct passwords after {seen.count:,} unique ones")
+                password = generate_password(length, classes, minimums, rng)
+            yield password
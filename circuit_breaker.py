@@ -0,0 +1,77 @@
+"""Thread-safe circuit breaker for an unreliable upstream service"""
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures and lets one probe through after a cool-down"""
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.rejected = 0
+        self.trips = 0
+
+    def _current_state(self):
+        if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._current_state()
+
+    def allow(self):
+        """Return True if a call may go upstream; half-open admits a single probe"""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self.trips += 1
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._probe_in_flight = False
+
+    def stats(self):
+        """Return the state, failure streak and seconds until the next probe"""
+        with self._lock:
+            state = self._current_state()
+            retry_in = 0.0
+            if state == OPEN:
+                retry_in = max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+            return {
+                'state': state,
+                'consecutive_failures': self._failures,
+                'retry_in': retry_in,
+                'rejected': self.rejected,
+                'trips': self.trips,
+            }
@@ -0,0 +1,199 @@
+"""Common-password lookup with popularity rank, built once per process
+
+Small lists live in a dict; lists of millions of entries are compiled into a
+sorted blob that is memory-mapped and binary searched:
+
+    python common_passwords.py build top-10-million.txt common_passwords.bin
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+MAGIC = b"PWLIST01"
+HEADER = struct.Struct("<8sQ")
+OFFSET = struct.Struct("<Q")
+RANK = struct.Struct("<I")
+
+DEFAULT_PASSWORDS = ['password', '123456', 'qwerty', 'admin', 'welcome']
+
+# Wordlist used by the analysis: a .bin blob or a text file, most common first
+WORDLIST_PATH = os.environ.get("COMMON_PASSWORDS_PATH", "")
+
+# Entries of a blob wordlist held in memory for the guess estimator, which
+# probes thousands of prefixes per password: too many for binary searches
+# over the memory map on every keystroke
+GUESS_DICTIONARY_SIZE = int(os.environ.get("GUESS_DICTIONARY_SIZE", "100000"))
+
+_default_list = None
+_guess_dictionary = None
+
+
+class CommonPasswordList:
+    """In-memory lowered password -> rank table for small lists"""
+
+    def __init__(self, passwords=(), ranks=None):
+        self._ranks = {} if ranks is None else ranks
+        for rank, password in enumerate(passwords, 1):
+            self._ranks.setdefault(password.lower(), rank)
+        # Sorted once here so the first has_prefix() does not pay for it
+        self._sorted = sorted(self._ranks)
+
+    def __len__(self):
+        return len(self._ranks)
+
+    def __contains__(self, password):
+        return password.lower() in self._ranks
+
+    def rank(self, password):
+        """Return the 1-based popularity rank of password, or None"""
+        return self._ranks.get(password.lower())
+
+    def has_prefix(self, prefix):
+        """Return True if any entry starts with the lowercase string prefix"""
+        i = bisect_left(self._sorted, prefix)
+        return i < len(self._sorted) and self._sorted[i].startswith(prefix)
+
+
+class CommonPasswordBlob:
+    """Memory-mapped sorted wordlist; lookups are a binary search over offsets"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a common-password blob")
+        self._offsets = HEADER.size
+        self._ranks = self._offsets + (self.count + 1) * OFFSET.size
+        self._data = self._ranks + self.count * RANK.size
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, password):
+        return self.rank(password) is not None
+
+    def _entry(self, i):
+        start, end = struct.unpack_from("<QQ", self._mm, self._offsets + i * OFFSET.size)
+        return self._mm[self._data + start:self._data + end]
+
+    def _lower_bound(self, key):
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def rank(self, password):
+        """Return the 1-based popularity rank of password, or None"""
+        key = password.lower().encode("utf-8")
+        i = self._lower_bound(key)
+        if i < self.count and self._entry(i) == key:
+            return RANK.unpack_from(self._mm, self._ranks + i * RANK.size)[0]
+        return None
+
+    def has_prefix(self, prefix):
+        """Return True if any entry starts with the lowercase string prefix"""
+        key = prefix.encode("utf-8")
+        i = self._lower_bound(key)
+        return i < self.count and self._entry(i).startswith(key)
+
+    def top(self, n):
+        """Return the entries ranked 1..n as an in-memory CommonPasswordList"""
+        ranks = array("I")
+        ranks.frombytes(self._mm[self._ranks:self._data])
+        if sys.byteorder == "big":
+            ranks.byteswap()
+        return CommonPasswordList(ranks={self._entry(i).decode("utf-8", "replace"): rank
+                                         for i, rank in enumerate(ranks) if rank <= n})
+
+
+def build_blob(passwords, dest):
+    """Compile passwords (most common first) into a sorted blob; returns the entry count"""
+    ranks = {}
+    for rank, password in enumerate(passwords, 1):
+        ranks.setdefault(password.lower().encode("utf-8"), rank)
+    entries = sorted(ranks)
+    tmp = dest + ".tmp"
+    with open(tmp, "wb") as out:
+        out.write(HEADER.pack(MAGIC, len(entries)))
+        offset = 0
+        out.write(OFFSET.pack(0))
+        for entry in entries:
+            offset += len(entry)
+            out.write(OFFSET.pack(offset))
+        for entry in entries:
+            out.write(RANK.pack(ranks[entry]))
+        for entry in entries:
+            out.write(entry)
+    os.replace(tmp, dest)
+    return len(entries)
+
+
+def read_wordlist(path):
+    """Yield passwords from a newline-delimited wordlist"""
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            password = line.rstrip("\r\n")
+            if password:
+                yield password
+
+
+def load(path):
+    """Load a wordlist: .bin files are memory-mapped, text files held in a dict"""
+    if path.endswith(".bin"):
+        return CommonPasswordBlob(path)
+    return CommonPasswordList(read_wordlist(path))
+
+
+def get_default_list():
+    """Return the process-wide wordlist, loading it on first use"""
+    global _default_list
+    if _default_list is None:
+        if WORDLIST_PATH and os.path.exists(WORDLIST_PATH):
+            _default_list = load(WORDLIST_PATH)
+        else:
+            _default_list = CommonPasswordList(DEFAULT_PASSWORDS)
+    return _default_list
+
+
+def get_guess_dictionary():
+    """Return the wordlist the guess estimator probes, loading it on first use
+
+    Text lists are used as they are. For a blob, only the top
+    GUESS_DICTIONARY_SIZE entries are held in memory; rarer entries add
+    little to a guess estimate but would cost a binary search per probe.
+    """
+    global _guess_dictionary
+    if _guess_dictionary is None:
+        wordlist = get_default_list()
+        if isinstance(wordlist, CommonPasswordBlob):
+            wordlist = wordlist.top(GUESS_DICTIONARY_SIZE)
+        _guess_dictionary = wordlist
+    return _guess_dictionary
+
+
+def rank(password):
+    """Return the popularity rank of password in the default wordlist, or None"""
+    return get_default_list().rank(password)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 3 or argv[0] != "build":
+        print("usage: python common_passwords.py build wordlist.txt common_passwords.bin")
+        return 2
+    count = build_blob(read_wordlist(argv[1]), argv[2])
+    print(f"Wrote {count} passwords to {argv[2]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
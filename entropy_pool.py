@@ -0,0 +1,161 @@
+"""Buffered CSPRNG for high-volume password generation
+
+EntropyPool reads os.urandom in large blocks and maps the bytes onto an
+alphabet with rejection sampling: bytes at or above the largest multiple of
+the alphabet size are discarded, so every character is exactly equally
+likely. For ASCII alphabets the mapping and rejection are a single
+bytes.translate call per block, which is much cheaper than a Python-level
+random call per character. Buffers are dropped in forked children, so
+worker processes never replay their parent's bytes.
+"""
+import os
+import threading
+import weakref
+
+BLOCK_SIZE = 64 * 1024
+
+# Largest multiple of n not above 256, for n = 1..256: bytes below it are unbiased mod n
+_BYTE_LIMITS = [0] + [256 - 256 % n for n in range(1, 257)]
+
+_pools = weakref.WeakSet()
+_default_pool = None
+
+
+class EntropyPool:
+    """Random choices and shuffles drawn from a reusable os.urandom buffer
+
+    Implements the choice/choices/sample/shuffle subset of random.Random,
+    plus randbelow_each() for drawing many bounded integers in one read.
+    """
+
+    def __init__(self, block_size=BLOCK_SIZE, source=os.urandom):
+        self.block_size = block_size
+        self._source = source
+        self._buffer = b''
+        self._pos = 0
+        self._lock = threading.Lock()
+        self._tables = {}
+        self.bytes_read = 0
+        _pools.add(self)
+
+    def _reset(self):
+        self._buffer = b''
+        self._pos = 0
+        self._lock = threading.Lock()
+
+    def _take(self, n):
+        """Return the next n random bytes"""
+        with self._lock:
+            start = self._pos
+            end = start + n
+            if end > len(self._buffer):
+                if n > self.block_size:
+                    self.bytes_read += n
+                    return self._source(n)
+                self._buffer = self._source(self.block_size)
+                self.bytes_read += self.block_size
+                start, end = 0, n
+            self._pos = end
+            return self._buffer[start:end]
+
+    def randbelow(self, n):
+        """Return a uniform integer in [0, n)"""
+        if n <= 0:
+            raise ValueError("randbelow() needs a positive bound")
+        if n <= 256:
+            width, limit = 1, _BYTE_LIMITS[n]
+        else:
+            width = (n.bit_length() + 7) // 8
+            space = 1 << (8 * width)
+            limit = space - space % n
+        while True:
+            value = int.from_bytes(self._take(width), 'little')
+            if value < limit:
+                return value % n
+
+    def randbelow_each(self, bounds):
+        """Return one uniform integer in [0, bound) per bound, from a single buffered read"""
+        if not bounds:
+            return []
+        if max(bounds) > 256:
+            return [self.randbelow(bound) for bound in bounds]
+        values = []
+        append, limits = values.append, _BYTE_LIMITS
+        remaining = iter(self._take(2 * len(bounds) + 16))
+        for bound in bounds:
+            limit = limits[bound]
+            for b in remaining:
+                if b < limit:
+                    append(b % bound)
+                    break
+            else:
+                # Ran out after unusually many rejections: draw fresh bytes
+                append(self.randbelow(bound))
+        return values
+
+    def choice(self, seq):
+        return seq[self.randbelow(len(seq))]
+
+    def sample(self, population, k):
+        """Return k distinct elements of population in random order"""
+        pool = list(population)
+        if not 0 <= k <= len(pool):
+            raise ValueError("sample larger than population or is negative")
+        for i, offset in enumerate(self.randbelow_each([len(pool) - i for i in range(k)])):
+            j = i + offset
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
+    def _translation(self, alphabet):
+        # (table, rejected bytes): byte b < limit maps to alphabet[b % n]
+        entry = self._tables.get(alphabet)
+        if entry is None:
+            n = len(alphabet)
+            limit = _BYTE_LIMITS[n]
+            encoded = alphabet.encode('ascii')
+            table = bytes(encoded[b % n] if b < limit else 0 for b in range(256))
+            entry = self._tables[alphabet] = (table, bytes(range(limit, 256)), limit)
+        return entry
+
+    def choice_bytes(self, alphabet, k):
+        """Return k independent uniform picks from an ASCII alphabet, as bytes"""
+        table, rejected, limit = self._tables.get(alphabet) or self._translation(alphabet)
+        picked = b''
+        while len(picked) < k:
+            # Ask for enough bytes that one round almost always suffices
+            raw = self._take((k - len(picked)) * 256 // limit + 8)
+            picked += raw.translate(table, rejected)
+        return picked[:k]
+
+    def choices(self, population, k=1):
+        """Return a list of k independent uniform picks from population"""
+        n = len(population)
+        if k <= 0:
+            return []
+        if not n:
+            raise IndexError("cannot choose from an empty population")
+        if isinstance(population, str) and n <= 256 and population.isascii():
+            return list(self.choice_bytes(population, k).decode('ascii'))
+        return [population[self.randbelow(n)] for _ in range(k)]
+
+    def shuffle(self, x):
+        """Shuffle list x in place (Fisher-Yates)"""
+        for i, j in zip(range(len(x) - 1, 0, -1), self.randbelow_each(range(len(x), 1, -1))):
+            x[i], x[j] = x[j], x[i]
+
+
+def _after_fork():
+    for pool in list(_pools):
+        pool._reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+def get_default_pool():
+    """Return the process-wide pool, creating it on first use"""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = EntropyPool()
+    return _default_pool
@@ -0,0 +1,429 @@
+"""Guess-count strength estimate in the style of zxcvbn
+
+Matchers for common-password words (plain, reversed and l33t), keyboard
+walks, repeats, character sequences, dates and years propose candidate
+tokens; a dynamic program then picks the decomposition of the password
+that needs the fewest guesses, with bruteforce filling the gaps.
+
+Work is bounded for every keystroke: only the first MAX_LENGTH characters are
+matched, the number of candidates, wordlist probes and date readings is
+capped, and the search considers at most MAX_TOKENS tokens, so a
+256-character input costs a few milliseconds (about ten with a
+multi-million-entry wordlist). Words are looked up in
+common_passwords.get_guess_dictionary(), which is always held in memory.
+"""
+import datetime
+import math
+import re
+
+import common_passwords
+
+MAX_LENGTH = 256
+MAX_TOKENS = 16
+MAX_MATCHES = 1024
+MAX_DICTIONARY_PROBES = 4096
+MAX_DATE_PROBES = 512
+MAX_WORD_LENGTH = 24
+MIN_WORD_LENGTH = 3
+MAX_REPEAT_BASE = 32
+
+BRUTEFORCE_LOG10 = 1.0  # ten guesses per bruteforced character
+MIN_SUBMATCH_LOG10_SINGLE = 1.0
+MIN_SUBMATCH_LOG10_MULTI = math.log10(50)
+MIN_GUESSES_BEFORE_GROWING_SEQUENCE_LOG10 = 4.0
+REFERENCE_YEAR = datetime.date.today().year
+MIN_YEAR_SPACE = 20
+
+# Guess-count thresholds (log10) for scores 1..4; below the first is score 0
+SCORE_THRESHOLDS = (3, 6, 8, 10)
+
+L33T_TABLE = str.maketrans({
+    '4': 'a', '@': 'a', '8': 'b', '(': 'c', '{': 'c', '[': 'c', '<': 'c',
+    '3': 'e', '6': 'g', '9': 'g', '1': 'i', '!': 'i', '|': 'l', '0': 'o',
+    '$': 's', '5': 's', '+': 't', '7': 't', '%': 'x', '2': 'z',
+})
+
+QWERTY_ROWS = (
+    ("`1234567890-=", "~!@#$%^&*()_+"),
+    ("qwertyuiop[]\\", "QWERTYUIOP{}|"),
+    ("asdfghjkl;'", 'ASDFGHJKL:"'),
+    ("zxcvbnm,./", "ZXCVBNM<>?"),
+)
+# Rows are offset by half a key, so each key touches two keys above and below
+DIRECTIONS = ((0, -1), (-1, 0), (-1, 1), (0, 1), (1, 0), (1, -1))
+
+_REPEAT_GREEDY = re.compile(r'(.{1,%d})\1+' % MAX_REPEAT_BASE, re.S)
+_REPEAT_LAZY = re.compile(r'(.{1,%d}?)\1+' % MAX_REPEAT_BASE, re.S)
+_REPEAT_BASE = re.compile(r'(.+?)\1+$', re.S)
+_YEAR = re.compile(r'19\d\d|20\d\d')
+_DATE_WITH_SEPARATOR = re.compile(r'(\d{1,4})([\s/\\_.-])(\d{1,2})\2(\d{1,4})')
+_DIGITS = re.compile(r'\d{4,8}')
+# Cut points for separator-free dates of each length (from zxcvbn)
+DATE_SPLITS = {
+    4: ((1, 2), (2, 3)),
+    5: ((1, 3), (2, 3)),
+    6: ((1, 2), (2, 4), (4, 5)),
+    7: ((1, 3), (2, 3), (4, 5), (4, 6)),
+    8: ((2, 4), (4, 6)),
+}
+
+
+def _build_keyboard():
+    positions = {}
+    for r, rows in enumerate(QWERTY_ROWS):
+        for shifted, row in enumerate(rows):
+            for c, ch in enumerate(row):
+                positions[ch] = (r, c, shifted)
+    keys = {(r, c) for r, c, _ in positions.values()}
+    degrees = [sum((r + dr, c + dc) in keys for dr, dc in DIRECTIONS) for r, c in keys]
+    return positions, len(keys), sum(degrees) / len(degrees)
+
+
+KEY_POSITIONS, KEYBOARD_STARTING_POSITIONS, KEYBOARD_AVERAGE_DEGREE = _build_keyboard()
+
+
+def _log10_sum_binomials(n, limit):
+    return math.log10(sum(math.comb(n, i) for i in range(1, limit + 1)))
+
+
+def _uppercase_variations(token):
+    """log10 of the ways to capitalize token as observed (zxcvbn)"""
+    upper = sum(1 for ch in token if ch.isupper())
+    lower = sum(1 for ch in token if ch.islower())
+    if upper == 0 or token.islower():
+        return 0.0
+    if token.isupper() or (upper == 1 and (token[0].isupper() or token[-1].isupper())):
+        return math.log10(2)
+    return _log10_sum_binomials(upper + lower, min(upper, lower))
+
+
+def _l33t_variations(token, unsubbed):
+    """log10 of the ways to l33t-substitute the letters of unsubbed as in token"""
+    total = 0.0
+    for letter in set(unsubbed):
+        subbed = sum(1 for a, b in zip(token.lower(), unsubbed) if b == letter and a != letter)
+        if not subbed:
+            continue
+        plain = sum(1 for a, b in zip(token.lower(), unsubbed) if b == letter and a == letter)
+        if plain == 0:
+            total += math.log10(2)
+        else:
+            total += _log10_sum_binomials(subbed + plain, min(subbed, plain))
+    return total
+
+
+def _dictionary_matches(password, wordlist, add):
+    n = len(password)
+    lowered = password.lower()
+    if len(lowered) != n:
+        return
+    variants = [(lowered, False)]
+    l33t = lowered.translate(L33T_TABLE)
+    if l33t != lowered:
+        variants.append((l33t, False))
+    reversed_lowered = lowered[::-1]
+    if reversed_lowered != lowered:
+        variants.append((reversed_lowered, True))
+
+    probes = 0
+    for text, is_reversed in variants:
+        for i in range(n):
+            for j in range(i + 1, min(n, i + MAX_WORD_LENGTH) + 1):
+                if probes >= MAX_DICTIONARY_PROBES:
+                    return
+                probes += 2
+                word = text[i:j]
+                if not wordlist.has_prefix(word):
+                    break
+                if j - i < MIN_WORD_LENGTH:
+                    continue
+                rank = wordlist.rank(word)
+                if rank is None:
+                    continue
+                start, end = (n - j, n - i) if is_reversed else (i, j)
+                token = password[start:end]
+                log10 = math.log10(rank) + _uppercase_variations(token)
+                if is_reversed:
+                    log10 += math.log10(2)
+                elif text is not lowered:
+                    log10 += _l33t_variations(token, word)
+                add(start, end, 'dictionary', log10)
+
+
+def _spatial_log10(length, turns, shifted):
+    s, d = KEYBOARD_STARTING_POSITIONS, KEYBOARD_AVERAGE_DEGREE
+    guesses = 0
+    for i in range(2, length + 1):
+        for j in range(1, min(turns, i - 1) + 1):
+            guesses += math.comb(i - 1, j - 1) * s * d ** j
+    log10 = math.log10(guesses)
+    unshifted = length - shifted
+    if shifted:
+        if unshifted == 0:
+            log10 += math.log10(2)
+        else:
+            log10 += _log10_sum_binomials(length, min(shifted, unshifted))
+    return log10
+
+
+def _spatial_matches(password, add):
+    n = len(password)
+    i = 0
+    while i < n - 2:
+        j = i
+        turns = 0
+        last_direction = None
+        shifted = 0
+        while j + 1 < n:
+            a, b = KEY_POSITIONS.get(password[j]), KEY_POSITIONS.get(password[j + 1])
+            if a is None or b is None:
+                break
+            step = (b[0] - a[0], b[1] - a[1])
+            if step not in DIRECTIONS:
+                break
+            if step != last_direction:
+                turns += 1
+                last_direction = step
+            shifted += b[2]
+            j += 1
+        if j - i + 1 >= 3:
+            if KEY_POSITIONS[password[i]][2]:
+                shifted += 1
+            add(i, j + 1, 'spatial', _spatial_log10(j - i + 1, turns, shifted))
+            i = j
+        else:
+            i += 1
+
+
+def _repeat_matches(password, add, depth):
+    base_cache = {}
+    pos = 0
+    n = len(password)
+    while pos < n:
+        greedy = _REPEAT_GREEDY.search(password, pos)
+        if greedy is None:
+            return
+        lazy = _REPEAT_LAZY.search(password, pos)
+        if len(greedy.group(0)) > len(lazy.group(0)):
+            match = greedy
+            base = _REPEAT_BASE.match(greedy.group(0)).group(1)
+        else:
+            match = lazy
+            base = lazy.group(1)
+        repeats = len(match.group(0)) // len(base)
+        # Only top-level repeats estimate their base; nested ones bruteforce it
+        if depth == 0 and len(base) > 1:
+            if base not in base_cache:
+                base_cache[base] = _estimate_log10(base, depth + 1)[0]
+            base_log10 = base_cache[base]
+        else:
+            base_log10 = len(base) * BRUTEFORCE_LOG10
+        add(match.start(), match.end(), 'repeat', base_log10 + math.log10(repeats))
+        pos = match.end()
+
+
+def _sequence_matches(password, add):
+    n = len(password)
+    i = 0
+    while i < n - 2:
+        delta = ord(password[i + 1]) - ord(password[i])
+        j = i + 1
+        while j + 1 < n and ord(password[j + 1]) - ord(password[j]) == delta:
+            j += 1
+        length = j - i + 1
+        if length >= 3 and 1 <= abs(delta) <= 5:
+            first = password[i]
+            if first in 'aAzZ019':
+                base = 4
+            elif first.isdigit():
+                base = 10
+            else:
+                base = 26
+            if delta < 0:
+                base *= 2
+            add(i, j + 1, 'sequence', math.log10(base * length))
+        i = j
+
+
+def _two_digit_year(year):
+    if year > 99:
+        return year
+    return year + (1900 if year > 50 else 2000)
+
+
+def _date_from_parts(parts):
+    """Best (year) reading of three integers as a day/month/year date, or None"""
+    best = None
+    for year, rest in ((parts[2], parts[:2]), (parts[0], parts[1:])):
+        if not (year <= 99 or 1000 <= year <= 2050):
+            continue
+        a, b = rest
+        if not ((1 <= a <= 31 and 1 <= b <= 12) or (1 <= b <= 31 and 1 <= a <= 12)):
+            continue
+        year = _two_digit_year(year)
+        if best is None or abs(year - REFERENCE_YEAR) < abs(best - REFERENCE_YEAR):
+            best = year
+    return best
+
+
+def _date_log10(year, separator):
+    log10 = math.log10(365 * max(abs(year - REFERENCE_YEAR), MIN_YEAR_SPACE))
+    return log10 + (math.log10(4) if separator else 0.0)
+
+
+def _date_matches(password, add):
+    for match in _YEAR.finditer(password):
+        year = int(match.group(0))
+        add(match.start(), match.end(), 'year',
+            math.log10(max(abs(year - REFERENCE_YEAR), MIN_YEAR_SPACE)))
+
+    candidates = []
+    probes = 0
+    for i in range(len(password)):
+        run = _DIGITS.match(password, i)
+        if run is None:
+            continue
+        if probes >= MAX_DATE_PROBES:
+            break
+        digits = run.group(0)
+        for length in range(4, len(digits) + 1):
+            token = digits[:length]
+            probes += len(DATE_SPLITS[length])
+            years = []
+            for k, l in DATE_SPLITS[length]:
+                year = _date_from_parts((int(token[:k]), int(token[k:l]), int(token[l:])))
+                if year is not None:
+                    years.append(year)
+            if years:
+                year = min(years, key=lambda y: abs(y - REFERENCE_YEAR))
+                candidates.append((i, i + length, _date_log10(year, False)))
+    pos = 0
+    while True:
+        match = _DATE_WITH_SEPARATOR.search(password, pos)
+        if match is None:
+            break
+        year = _date_from_parts((int(match.group(1)), int(match.group(3)), int(match.group(4))))
+        if year is not None:
+            candidates.append((match.start(), match.end(), _date_log10(year, True)))
+        pos = match.start() + 1
+
+    # Like zxcvbn, drop dates lying inside a longer date match
+    spans = {}
+    for start, end, log10 in candidates:
+        spans[start, end] = min(log10, spans.get((start, end), log10))
+    reach = -1
+    for (start, end), log10 in sorted(spans.items(), key=lambda item: (item[0][0], -item[0][1])):
+        if end > reach:
+            add(start, end, 'date', log10)
+            reach = end
+
+
+def _log10_add(a, b):
+    """log10(10**a + 10**b) without overflow"""
+    hi, lo = max(a, b), min(a, b)
+    return hi + math.log10(1 + 10 ** (lo - hi))
+
+
+def _estimate_log10(password, depth=0):
+    """Return (log10 guesses, [(start, end, pattern, log10)]) for the best decomposition"""
+    n = len(password)
+    if n == 0:
+        return 0.0, []
+
+    by_end = [[] for _ in range(n + 1)]
+    count = [0]
+
+    def add(start, end, pattern, log10):
+        if count[0] >= MAX_MATCHES:
+            return
+        if end - start < n:
+            floor = MIN_SUBMATCH_LOG10_SINGLE if end - start == 1 else MIN_SUBMATCH_LOG10_MULTI
+            log10 = max(log10, floor)
+        by_end[end].append((start, pattern, log10))
+        count[0] += 1
+
+    _dictionary_matches(password, common_passwords.get_guess_dictionary(), add)
+    _spatial_matches(password, add)
+    _repeat_matches(password, add, depth)
+    _sequence_matches(password, add)
+    _date_matches(password, add)
+
+    # bf[k][l]: best log10 product covering password[:k] with l tokens, the
+    # last being a bruteforce run; mt[k][l]: same, last token a match.
+    inf = math.inf
+    tokens = min(MAX_TOKENS, n)
+    bf = [[inf] * (tokens + 1) for _ in range(n + 1)]
+    mt = [[inf] * (tokens + 1) for _ in range(n + 1)]
+    bf_back = [[None] * (tokens + 1) for _ in range(n + 1)]
+    mt_back = [[None] * (tokens + 1) for _ in range(n + 1)]
+    mt[0][0] = 0.0
+    for k in range(1, n + 1):
+        bf_prev, mt_prev = bf[k - 1], mt[k - 1]
+        bf_k, mt_k = bf[k], mt[k]
+        for l in range(1, tokens + 1):
+            extend = bf_prev[l] + BRUTEFORCE_LOG10
+            start = mt_prev[l - 1] + BRUTEFORCE_LOG10
+            if extend <= start:
+                bf_k[l], bf_back[k][l] = extend, 'bf'
+            else:
+                bf_k[l], bf_back[k][l] = start, 'mt'
+        for start, pattern, log10 in by_end[k]:
+            bf_s, mt_s = bf[start], mt[start]
+            for l in range(1, tokens + 1):
+                prev_bf, prev_mt = bf_s[l - 1], mt_s[l - 1]
+                prev, source = (prev_bf, 'bf') if prev_bf < prev_mt else (prev_mt, 'mt')
+                total = prev + log10
+                if total < mt_k[l]:
+                    mt_k[l] = total
+                    mt_back[k][l] = (start, pattern, log10, source)
+
+    best, best_l, best_table = inf, 0, None
+    for l in range(1, tokens + 1):
+        for table, name in ((bf[n], 'bf'), (mt[n], 'mt')):
+            if table[l] == inf:
+                continue
+            log10 = _log10_add(math.log10(math.factorial(l)) + table[l],
+                               MIN_GUESSES_BEFORE_GROWING_SEQUENCE_LOG10 * (l - 1))
+            if log10 < best:
+                best, best_l, best_table = log10, l, name
+
+    sequence = []
+    k, l, table = n, best_l, best_table
+    while k > 0:
+        if table == 'bf':
+            end = k
+            while table == 'bf':
+                source = bf_back[k][l]
+                k -= 1
+                if source == 'mt':
+                    l -= 1
+                    table = 'mt'
+            sequence.append((k, end, 'bruteforce', (end - k) * BRUTEFORCE_LOG10))
+        else:
+            start, pattern, log10, source = mt_back[k][l]
+            sequence.append((start, k, pattern, log10))
+            k, l, table = start, l - 1, source
+    sequence.reverse()
+    return best, sequence
+
+
+def guess_score(log10_guesses):
+    """Map a log10 guess count onto zxcvbn's 0-4 scale"""
+    return sum(log10_guesses >= threshold for threshold in SCORE_THRESHOLDS)
+
+
+def estimate_guesses(password):
+    """Estimate how many guesses an attacker needs for password
+
+    Returns a dict with 'guesses_log10', 'guess_score' (0-4) and 'sequence',
+    the chosen (start, end, pattern, log10 guesses) tokens.
+    """
+    head = password[:MAX_LENGTH]
+    log10, sequence = _estimate_log10(head)
+    # Characters past MAX_LENGTH are counted as bruteforce
+    log10 += (len(password) - len(head)) * BRUTEFORCE_LOG10
+    return {
+        'guesses_log10': log10,
+        'guess_score': guess_score(log10),
+        'sequence': sequence,
+    }
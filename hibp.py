@@ -0,0 +1,224 @@
+"""Client for the Have I Been Pwned range API"""
+import asyncio
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha1
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from circuit_breaker import CircuitBreaker
+from single_flight import SingleFlight
+from ttl_cache import TTLCache
+
+API_URL = "https://api.pwnedpasswords.com"
+
+# (connect, read) timeouts in seconds; bounds the time a rerun can block on HIBP
+TIMEOUT = (
+    float(os.environ.get("HIBP_CONNECT_TIMEOUT", "2")),
+    float(os.environ.get("HIBP_READ_TIMEOUT", "3")),
+)
+MAX_RETRIES = int(os.environ.get("HIBP_MAX_RETRIES", "2"))
+# Longest Retry-After honoured before a retry; longer waits are cut to this
+# so a rate-limited request stays within its timeouts and the circuit
+# breaker, not a sleeping request, absorbs sustained rate limiting
+RETRY_AFTER_MAX = float(os.environ.get("HIBP_RETRY_AFTER_MAX", "1"))
+POOL_SIZE = int(os.environ.get("HIBP_POOL_SIZE", "16"))
+
+_session = None
+_session_pool_size = 0
+_session_lock = threading.Lock()
+
+# Shared by every session: after repeated failures lookups fail fast until a
+# probe succeeds, instead of each rerun waiting out the timeouts again
+breaker = CircuitBreaker(
+    failure_threshold=int(os.environ.get("HIBP_BREAKER_FAILURES", "5")),
+    reset_timeout=float(os.environ.get("HIBP_BREAKER_COOLDOWN", "30")),
+)
+
+# Concurrent sessions missing the same prefix share a single download
+range_flights = SingleFlight()
+
+# One entry per 5-hex prefix, each holding the raw response body; lookups
+# search it in place with find_count, so a cache hit needs no parsing
+range_cache = TTLCache(
+    maxsize=int(os.environ.get("HIBP_CACHE_SIZE", "4096")),
+    ttl=float(os.environ.get("HIBP_CACHE_TTL", "3600")),
+)
+
+
+class BreachCheckUnavailable(Exception):
+    """The breach API could not be consulted"""
+
+
+class _BoundedRetry(Retry):
+    """Retry policy that never sleeps longer than RETRY_AFTER_MAX for Retry-After"""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, RETRY_AFTER_MAX)
+
+
+def _build_session(pool_size):
+    retry = _BoundedRetry(
+        total=MAX_RETRIES,
+        connect=MAX_RETRIES,
+        read=MAX_RETRIES,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # ACCEPT_ENCODING includes "br" when a brotli decoder is installed
+    session.headers.update({
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "User-Agent": "Password-Strength-Checker",
+        # Pads every range to a similar size so response length leaks nothing
+        "Add-Padding": "true",
+    })
+    return session
+
+
+def get_session(pool_size=POOL_SIZE):
+    """Return the keep-alive session shared by every lookup in this process
+
+    The session keeps up to pool_size connections alive. Asking for more than
+    it was built with replaces it with a larger one, so wide fan-outs reuse
+    connections instead of discarding them.
+    """
+    global _session, _session_pool_size
+    if _session is None or pool_size > _session_pool_size:
+        with _session_lock:
+            if _session is None or pool_size > _session_pool_size:
+                _session_pool_size = max(pool_size, _session_pool_size)
+                _session = _build_session(_session_pool_size)
+    return _session
+
+
+def find_count(body, suffix):
+    """Return the count for a hash suffix in a raw range body, or 0 if absent
+
+    Searches the response bytes directly instead of splitting ~800 lines.
+    Every line is "<35 hex>:<count>", so a match on suffix + ":" can only
+    start at a line boundary. Add-Padding rows carry a count of 0.
+    """
+    start = body.find(suffix.encode('ascii') + b':')
+    if start < 0:
+        return 0
+    start += len(suffix) + 1
+    end = body.find(b'\n', start)
+    return int(body[start:end] if end >= 0 else body[start:])
+
+
+def iter_range(body):
+    """Yield (suffix, count) pairs from a raw range body, skipping padding rows"""
+    for line in body.split(b'\n'):
+        suffix, _, count = line.partition(b':')
+        if suffix and count.strip() != b'0':
+            yield suffix.decode('ascii'), int(count)
+
+
+def download_range(prefix, base_url=API_URL):
+    """Fetch one raw range body from the API, bypassing the cache (None on HTTP error)"""
+    response = get_session().get(f"{base_url}/range/{prefix}", timeout=TIMEOUT)
+    if response.status_code != 200:
+        return None
+    return response.content
+
+
+def fetch_range(prefix):
+    """Return the raw range body for a 5-character hash prefix
+
+    Raises BreachCheckUnavailable while the circuit breaker is open or when
+    the API cannot be reached.
+    """
+    body = range_cache.get(prefix)
+    if body is not None:
+        return body
+    return range_flights.do(prefix, lambda: _load_range(prefix))
+
+
+def _load_range(prefix):
+    if not breaker.allow():
+        raise BreachCheckUnavailable("breach check temporarily disabled after upstream failures")
+    try:
+        body = download_range(prefix)
+    except Exception as e:
+        breaker.record_failure()
+        raise BreachCheckUnavailable(str(e)) from e
+    if body is None:
+        breaker.record_failure()
+        raise BreachCheckUnavailable("unexpected response from the breach API")
+    breaker.record_success()
+    range_cache.set(prefix, body)
+    return body
+
+
+def lookup_count(sha1_hex):
+    """Return how often an uppercase hex SHA-1 digest appears in the breach corpus"""
+    return find_count(fetch_range(sha1_hex[:5]), sha1_hex[5:])
+
+
+def cache_stats():
+    """Return hit/miss counters for the range cache"""
+    return range_cache.stats()
+
+
+def breaker_stats():
+    """Return the circuit breaker state and counters"""
+    return breaker.stats()
+
+
+def flight_stats():
+    """Return how many range downloads were shared between concurrent lookups"""
+    return range_flights.stats()
+
+
+async def check_passwords_async(passwords, base_url=API_URL, concurrency=16):
+    """Return breach counts for many passwords, fetching each distinct prefix once
+
+    Results line up with the input; a password whose range could not be
+    fetched gets None, mirroring check_breached_password. Up to concurrency
+    ranges are downloaded at once, on a thread pool of that size.
+    """
+    digests = [sha1(p.encode('utf-8')).hexdigest().upper() for p in passwords]
+    groups = defaultdict(list)
+    for i, digest in enumerate(digests):
+        groups[digest[:5]].append(i)
+
+    results = [None] * len(digests)
+    if not groups:
+        return results
+    workers = min(concurrency, len(groups))
+    get_session(workers)
+    loop = asyncio.get_running_loop()
+
+    async def resolve(executor, prefix, indices):
+        try:
+            body = await loop.run_in_executor(executor, download_range, prefix, base_url)
+        except Exception:
+            return
+        if body is None:
+            return
+        for i in indices:
+            results[i] = find_count(body, digests[i][5:])
+
+    # The loop's default executor caps at min(32, cpu_count + 4) threads,
+    # which would silently bound concurrency; use a pool of the asked size
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        await asyncio.gather(*(resolve(executor, prefix, indices)
+                               for prefix, indices in groups.items()))
+    return results
+
+
+def check_passwords(passwords, base_url=API_URL, concurrency=16):
+    """Blocking wrapper around check_passwords_async for scripts and audits"""
+    return asyncio.run(check_passwords_async(passwords, base_url, concurrency))
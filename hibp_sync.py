@@ -0,0 +1,194 @@
+"""Mirror every HIBP range into a local SQLite store and export it as a breach index
+
+    python hibp_sync.py sync pwned_ranges.db [--workers 16] [--endpoint URL] [--refresh]
+    python hibp_sync.py export pwned_ranges.db pwned_index.bin
+
+Progress is committed as ranges arrive, so an interrupted sync resumes where
+it stopped. With --refresh, stored ranges are revalidated with
+If-None-Match/If-Modified-Since and only changed ranges are downloaded.
+"""
+import argparse
+import sqlite3
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import breach_index
+import hibp
+
+PREFIX_COUNT = 16 ** 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ranges (
+    prefix TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    records BLOB NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def open_store(path):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def pack_range(prefix, body):
+    """Pack a raw range body into sorted index records, dropping padding rows"""
+    records = sorted(
+        (bytes.fromhex(prefix + suffix), count)
+        for suffix, count in hibp.iter_range(body)
+    )
+    return b"".join(breach_index.RECORD.pack(digest, min(count, 0xFFFFFFFF))
+                    for digest, count in records)
+
+
+def fetch_range(prefix, endpoint, etag=None, last_modified=None):
+    """Download one range; records is None when the server answers 304"""
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    response = hibp.get_session().get(f"{endpoint}/range/{prefix}", headers=headers,
+                                      timeout=hibp.TIMEOUT)
+    if response.status_code == 304:
+        return prefix, None, etag, last_modified
+    response.raise_for_status()
+    return (prefix, pack_range(prefix, response.content),
+            response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+
+def _get_meta(conn, key):
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def sync(store, endpoint=hibp.API_URL, workers=hibp.POOL_SIZE, refresh=False,
+         checkpoint=500, log=print):
+    """Fetch every missing (or, with refresh, every stale) range into the store"""
+    conn = open_store(store)
+    # One keep-alive connection per worker
+    hibp.get_session(workers)
+    validators = {}
+    if refresh:
+        # Keep the refresh start time so an interrupted refresh resumes too
+        started = _get_meta(conn, "refresh_started")
+        if started is None:
+            started = repr(time.time())
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('refresh_started', ?)", (started,))
+            conn.commit()
+        done = {row[0] for row in conn.execute(
+            "SELECT prefix FROM ranges WHERE synced_at >= ?", (float(started),))}
+        for prefix, etag, last_modified in conn.execute(
+                "SELECT prefix, etag, last_modified FROM ranges WHERE synced_at < ?",
+                (float(started),)):
+            validators[prefix] = (etag, last_modified)
+    else:
+        done = {row[0] for row in conn.execute("SELECT prefix FROM ranges")}
+
+    todo = (f"{i:05X}" for i in range(PREFIX_COUNT))
+    todo = (prefix for prefix in todo if prefix not in done)
+    total = PREFIX_COUNT - len(done)
+    fetched = unchanged = failed = pending_commit = 0
+    start = time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        in_flight = set()
+        exhausted = False
+        while in_flight or not exhausted:
+            while not exhausted and len(in_flight) < workers * 4:
+                prefix = next(todo, None)
+                if prefix is None:
+                    exhausted = True
+                    break
+                etag, last_modified = validators.get(prefix, (None, None))
+                in_flight.add(pool.submit(fetch_range, prefix, endpoint, etag, last_modified))
+            if not in_flight:
+                break
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                try:
+                    prefix, records, etag, last_modified = future.result()
+                except Exception:
+                    failed += 1
+                    continue
+                if records is None:
+                    conn.execute("UPDATE ranges SET synced_at = ? WHERE prefix = ?",
+                                 (time.time(), prefix))
+                    unchanged += 1
+                else:
+                    conn.execute("INSERT OR REPLACE INTO ranges VALUES (?, ?, ?, ?, ?)",
+                                 (prefix, etag, last_modified, records, time.time()))
+                    fetched += 1
+                pending_commit += 1
+            if pending_commit >= checkpoint:
+                conn.commit()
+                pending_commit = 0
+                processed = fetched + unchanged + failed
+                rate = processed / max(time.monotonic() - start, 1e-9)
+                log(f"{processed}/{total} ranges ({rate:.0f}/s), {failed} failed")
+    conn.commit()
+
+    if refresh and not failed:
+        conn.execute("DELETE FROM meta WHERE key = 'refresh_started'")
+        conn.commit()
+    conn.close()
+    log(f"Done: {fetched} downloaded, {unchanged} unchanged, {failed} failed"
+        + (" (re-run to retry)" if failed else ""))
+    return {'fetched': fetched, 'unchanged': unchanged, 'failed': failed}
+
+
+def iter_store_records(conn):
+    """Yield (digest, count) records from the store in hash order"""
+    for (records,) in conn.execute("SELECT records FROM ranges ORDER BY prefix"):
+        yield from breach_index.RECORD.iter_unpack(records)
+
+
+def export(store, dest):
+    """Write the store out as a breach index file and return the record count"""
+    conn = open_store(store)
+    try:
+        (stored,) = conn.execute("SELECT COUNT(*) FROM ranges").fetchone()
+        if stored < PREFIX_COUNT:
+            print(f"Warning: only {stored}/{PREFIX_COUNT} ranges synced", file=sys.stderr)
+        return breach_index.build_index(iter_store_records(conn), dest)
+    finally:
+        conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mirror HIBP ranges for offline breach checks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sync_cmd = commands.add_parser("sync", help="download ranges into the store")
+    sync_cmd.add_argument("store")
+    sync_cmd.add_argument("--endpoint", default=hibp.API_URL, help="API base URL")
+    sync_cmd.add_argument("--workers", type=int, default=hibp.POOL_SIZE)
+    sync_cmd.add_argument("--checkpoint", type=int, default=500, help="ranges per commit")
+    sync_cmd.add_argument("--refresh", action="store_true",
+                          help="revalidate stored ranges and download changed ones")
+
+    export_cmd = commands.add_parser("export", help="write the store as a breach index")
+    export_cmd.add_argument("store")
+    export_cmd.add_argument("dest")
+
+    args = parser.parse_args(argv)
+    if args.command == "sync":
+        result = sync(args.store, args.endpoint, args.workers, args.refresh, args.checkpoint)
+        return 1 if result['failed'] else 0
+    count = export(args.store, args.dest)
+    print(f"Wrote {count} hashes to {args.dest}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
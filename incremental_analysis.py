@@ -0,0 +1,104 @@
+"""Incremental re-analysis of a password that is edited as the user types
+
+Streamlit reruns the page on every keystroke, and most keystrokes append or
+delete one character at the end. IncrementalAnalysis keeps one small frame
+per prefix of the current text (class counts, current and longest run, the
+sequence automaton state and the spans found so far), so those edits cost
+O(1) per changed character. Any other edit replays from the first changed
+position, which for an edit at the start is a full recompute.
+"""
+import sequence_matcher
+from password_analysis import SPECIAL_CHARS, build_analysis
+
+# (upper, lower, digits, special, last char, run, max run, automaton state, spans)
+_EMPTY_FRAME = (0, 0, 0, 0, None, 0, 0, 0, None)
+
+
+def _common_prefix_length(a, b):
+    if b.startswith(a):
+        return len(a)
+    if a.startswith(b):
+        return len(b)
+    n = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        n += 1
+    return n
+
+
+def _span_list(node):
+    # Spans are kept as a linked list, newest first: (start, end, previous)
+    spans = []
+    while node is not None:
+        spans.append((node[0], node[1]))
+        node = node[2]
+    spans.reverse()
+    return spans
+
+
+class IncrementalAnalysis:
+    """Analysis state for one text field; update() matches local_password_analysis"""
+
+    def __init__(self, matcher=None, guesses=True):
+        self.matcher = matcher or sequence_matcher.get_default_matcher()
+        self.guesses = guesses
+        self.text = ''
+        self.lowered_length = [0]
+        self._frames = [_EMPTY_FRAME]
+        self.replayed = 0
+
+    def _step(self, frame, ch, lowered_length):
+        upper, lower, digits, special, last, run, max_run, state, spans = frame
+        if 'A' <= ch <= 'Z':
+            upper += 1
+        elif 'a' <= ch <= 'z':
+            lower += 1
+        elif ch.isdecimal():
+            digits += 1
+        elif ch in SPECIAL_CHARS:
+            special += 1
+
+        run = run + 1 if ch == last else 1
+        if ch != '\n' and run > max_run:
+            max_run = run
+
+        # Sequence spans are positions in the lowered text, which can be
+        # longer than the password (e.g. 'İ' lowers to two characters)
+        for lowered_ch in ch.lower():
+            state, length = self.matcher.step(state, lowered_ch)
+            lowered_length += 1
+            if length:
+                start = lowered_length - length
+                if spans is not None and start <= spans[1]:
+                    spans = (min(spans[0], start), lowered_length, spans[2])
+                else:
+                    spans = (start, lowered_length, spans)
+        return (upper, lower, digits, special, ch, run, max_run, state, spans), lowered_length
+
+    def update(self, password):
+        """Bring the state up to date with password and return its analysis"""
+        keep = _common_prefix_length(self.text, password)
+        del self._frames[keep + 1:]
+        del self.lowered_length[keep + 1:]
+        frame, lowered_length = self._frames[-1], self.lowered_length[-1]
+        for ch in password[keep:]:
+            frame, lowered_length = self._step(frame, ch, lowered_length)
+            self._frames.append(frame)
+            self.lowered_length.append(lowered_length)
+        self.replayed = len(password) - keep
+        self.text = password
+        return self.analysis()
+
+    def analysis(self):
+        """Analysis dict for the current text"""
+        upper, lower, digits, special, _, _, max_run, _, spans = self._frames[-1]
+        counts = {
+            'upper_count': upper,
+            'lower_count': lower,
+            'digit_count': digits,
+            'special_count': special,
+            'max_run': max_run,
+        }
+        return build_analysis(self.text, self.text.lower(), counts, _span_list(spans),
+                              self.guesses)
@@ -0,0 +1,172 @@
+"""Local password analysis, scoring and feedback (no Streamlit or network access)"""
+import string
+import sys
+from itertools import groupby
+
+import common_passwords
+import scoring_policy
+from guess_estimator import estimate_guesses
+from sequence_matcher import find_sequences
+
+SPECIAL_CHARS = '!@#$%^&*(),.?":{}|<>'
+
+# Ratings that get improvement tips, and the length below which one is given
+FEEDBACK_RATINGS = ("Weak", "Moderate")
+FEEDBACK_MIN_LENGTH = 12
+
+_feedback_bundles = None
+
+# Byte -> class letter (U)pper, (L)ower, (D)igit, (S)pecial, anything else '.'
+_ASCII_CLASSES = bytearray(b'.' * 256)
+for _chars, _cls in ((string.ascii_uppercase, b'U'), (string.ascii_lowercase, b'L'),
+                     (string.digits, b'D'), (SPECIAL_CHARS, b'S')):
+    for _c in _chars.encode('ascii'):
+        _ASCII_CLASSES[_c] = _cls[0]
+_ASCII_CLASSES = bytes(_ASCII_CLASSES)
+
+
+def scan_characters(password):
+    """Count character classes and the longest repeat run in a single pass"""
+    if password.isascii():
+        # Fast path: one C-level translate instead of a regex per class
+        classes = password.encode('ascii').translate(_ASCII_CLASSES)
+        upper, lower = classes.count(b'U'), classes.count(b'L')
+        digits, special = classes.count(b'D'), classes.count(b'S')
+    else:
+        upper = lower = digits = special = 0
+        for ch in password:
+            if 'A' <= ch <= 'Z':
+                upper += 1
+            elif 'a' <= ch <= 'z':
+                lower += 1
+            elif ch.isdecimal():
+                digits += 1
+            elif ch in SPECIAL_CHARS:
+                special += 1
+    # Runs of newlines never counted as repeats ('.' in the old regex)
+    max_run = max((len(list(run)) for ch, run in groupby(password) if ch != '\n'), default=0)
+    return {
+        'upper_count': upper,
+        'lower_count': lower,
+        'digit_count': digits,
+        'special_count': special,
+        'max_run': max_run,
+    }
+
+
+def local_password_analysis(password, guesses=True):
+    """Analyze password characteristics that need no network access"""
+    lowered = password.lower()
+    return build_analysis(password, lowered, scan_characters(password),
+                          find_sequences(lowered), guesses)
+
+
+def build_analysis(password, lowered, counts, sequence_spans, guesses=True):
+    """Assemble the analysis dict from precomputed character counts and sequence spans"""
+    common_rank = common_passwords.rank(lowered)
+    analysis = {
+        'length': len(str(password)),
+        'uppercase': counts['upper_count'] > 0,
+        'lowercase': counts['lower_count'] > 0,
+        'digit': counts['digit_count'] > 0,
+        'special': counts['special_count'] > 0,
+        'repeating': counts['max_run'] >= 3,
+        'sequences': bool(sequence_spans),
+        'sequence_spans': sequence_spans,
+        'common': common_rank is not None,
+        'common_rank': common_rank,
+        **counts,
+    }
+    if guesses:
+        estimate = estimate_guesses(password)
+        analysis['guesses_log10'] = estimate['guesses_log10']
+        analysis['guess_score'] = estimate['guess_score']
+    return analysis
+
+
+def password_spans(password, spans):
+    """Map sequence_spans, which index password.lower(), to positions in password
+
+    Lowering can lengthen the text (e.g. 'İ' becomes two characters), so the
+    two only differ for such passwords.
+    """
+    if len(password.lower()) == len(password):
+        return list(spans)
+    # Index in password of each lowered character, plus one past the end
+    owner = [i for i, ch in enumerate(password) for _ in ch.lower()]
+    owner.append(len(password))
+    return [(owner[start], owner[end - 1] + 1) for start, end in spans]
+
+
+def calculate_score_and_rating(analysis):
+    """Calculate password strength score and assign rating (see scoring_policy)"""
+    return scoring_policy.get_policy().score(analysis)
+
+
+def generate_improvement_feedback(analysis, rating):
+    """Provide specific feedback to improve weak passwords
+
+    Returns a shared, precomputed tuple; see feedback_bundles().
+    """
+    index = feedback_index(analysis['length'], scoring_policy.feature_mask(analysis),
+                           rating in FEEDBACK_RATINGS,
+                           scoring_policy.get_policy().guess_capped(analysis))
+    return feedback_bundles()[index]
+
+
+def feedback_index(length, mask, needs_tips, guess_capped=False):
+    """Position in feedback_bundles() for a length, feature mask, rating and guess cap"""
+    length = min(length, FEEDBACK_MIN_LENGTH)
+    row = (guess_capped * 2 + needs_tips) * (FEEDBACK_MIN_LENGTH + 1) + length
+    return (row << len(scoring_policy.FEATURES)) | mask
+
+
+def feedback_bundles():
+    """Every distinct feedback tuple, built once per process on first use
+
+    Feedback depends only on the feature mask, whether the rating gets tips,
+    whether the guess cap lowered the score and the length below
+    FEEDBACK_MIN_LENGTH, so all combinations are composed up front and
+    callers share the same interned tuples.
+    """
+    global _feedback_bundles
+    if _feedback_bundles is None:
+        features = scoring_policy.FEATURES
+        bundles = []
+        for guess_capped in (False, True):
+            for rating in ("Strong", "Weak"):
+                for length in range(FEEDBACK_MIN_LENGTH + 1):
+                    for mask in range(1 << len(features)):
+                        analysis = {name: bool(mask & (1 << bit)) for bit, name in enumerate(features)}
+                        analysis['length'] = length
+                        tips = _compose_feedback(analysis, rating, guess_capped)
+                        bundles.append(tuple(sys.intern(tip) for tip in tips))
+        _feedback_bundles = bundles
+    return _feedback_bundles
+
+
+def _compose_feedback(analysis, rating, guess_capped=False):
+    feedback = []
+    
+    if rating in FEEDBACK_RATINGS:
+        if analysis['length'] < FEEDBACK_MIN_LENGTH:
+            feedback.append(f"Increase length to at least {FEEDBACK_MIN_LENGTH} characters (currently {analysis['length']})")
+        if not analysis['uppercase']:
+            feedback.append("Add uppercase letters (e.g., A, B, C)")
+        if not analysis['lowercase']:
+            feedback.append("Add lowercase letters (e.g., a, b, c)")
+        if not analysis['digit']:
+            feedback.append("Include numbers (e.g., 0-9)")
+        if not analysis['special']:
+            feedback.append("Add special characters (e.g., !@#$%^&*)")
+        if analysis['repeating']:
+            feedback.append("Avoid repeating characters (e.g., aaa)")
+        if analysis['sequences']:
+            feedback.append("Remove predictable sequences (e.g., 1234, qwerty)")
+        if analysis['common']:
+            feedback.append("Avoid common passwords (e.g., 'password')")
+        if guess_capped:
+            feedback.append("Avoid common words, dates and keyboard patterns - "
+                            "this password is easy to guess")
+    
+    return feedback if feedback else ["Password is strong - great job!"]
@@ -0,0 +1,76 @@
+"""Headless password engine: analysis, scoring, feedback, generation and breach lookup
+
+Importing this module is cheap and has no side effects. The HTTP client
+(requests, via hibp), the offline breach files, the common-password list and
+the sequence automaton are all loaded on first use, so command-line tools and
+other callers only pay for what they touch. The Streamlit page is a front end
+over these functions.
+"""
+from hashlib import sha1
+
+import analysis_cache
+import breach_filter
+import breach_index
+from incremental_analysis import IncrementalAnalysis  # noqa: F401
+from password_analysis import (  # noqa: F401
+    calculate_score_and_rating,
+    generate_improvement_feedback,
+    local_password_analysis,
+    password_spans,
+)
+from password_generator import character_classes, generate_password, password_entropy  # noqa: F401
+
+
+def lookup_breach_count(password):
+    """Look up the breach count of password, or None if no source is reachable"""
+    sha1password = sha1(password.encode('utf-8')).hexdigest().upper()
+    try:
+        # Bloom filter answers "not breached" without touching the index or network
+        bloom = breach_filter.get_default_filter()
+        if bloom is not None and bytes.fromhex(sha1password) not in bloom:
+            return 0
+        # Offline index (PWNED_INDEX_PATH) avoids a network round trip per rerun
+        index = breach_index.get_default_index()
+        if index is not None:
+            return index.lookup_hex(sha1password)
+        import hibp
+        return hibp.lookup_count(sha1password)
+    except Exception:
+        return None
+
+
+def check_breached_password(password):
+    """Check password against Have I Been Pwned database (memoized per process)"""
+    return analysis_cache.breach_count(password, lookup_breach_count)
+
+
+def password_strength_analysis(password):
+    """Analyze password characteristics"""
+    analysis = local_password_analysis(password)
+    analysis['breach_count'] = check_breached_password(password)
+    return analysis
+
+
+def generate_advanced_password(length=16, include_special=True, include_numbers=True,
+                               include_upper=True, include_lower=True, exclude_ambiguous=False,
+                               min_per_class=1):
+    """Generate a secure random password with min_per_class of each selected class"""
+    classes = character_classes(include_upper, include_lower, include_numbers, include_special,
+                                exclude_ambiguous)
+    return generate_password(length, classes, min_per_class)
+
+
+def breach_status():
+    """Statistics of the breach-check caches, upstream circuit and offline filter"""
+    import hibp
+    bloom = breach_filter.get_default_filter()
+    return {
+        'range_cache': hibp.cache_stats(),
+        'flights': hibp.flight_stats(),
+        'breaker': hibp.breaker_stats(),
+        'results': analysis_cache.stats(),
+        'filter': None if bloom is None else {
+            'count': bloom.count,
+            'memory_bytes': bloom.memory_bytes,
+        },
+    }
@@ -0,0 +1,136 @@
+"""Constraint-based password generation
+
+A password is built directly from its constraints: the required minimum of
+each character class is drawn first, the remaining positions are filled
+uniformly from all enabled classes, and the result is securely shuffled.
+There is no rejection loop and no analysis or breach lookup, so every call
+costs the same and never touches the network. Randomness comes from a
+buffered os.urandom pool (see entropy_pool).
+"""
+import functools
+import math
+import string
+
+import entropy_pool
+
+SPECIAL_CHARS = '!@#$%^&*'
+
+# Characters easily confused with one another when read or typed
+AMBIGUOUS_CHARS = 'Il1O0o'
+
+
+def character_classes(include_upper=True, include_lower=True, include_numbers=True,
+                      include_special=True, exclude_ambiguous=False):
+    """Return the enabled character classes as a tuple of strings"""
+    classes = []
+    for enabled, chars in ((include_upper, string.ascii_uppercase),
+                           (include_lower, string.ascii_lowercase),
+                           (include_numbers, string.digits),
+                           (include_special, SPECIAL_CHARS)):
+        if enabled:
+            if exclude_ambiguous:
+                chars = ''.join(c for c in chars if c not in AMBIGUOUS_CHARS)
+            classes.append(chars)
+    return tuple(classes)
+
+
+def _minimums(classes, minimums, length):
+    if not classes:
+        raise ValueError("select at least one character class")
+    if minimums is None:
+        minimums = (1,) * len(classes)
+    elif isinstance(minimums, int):
+        minimums = (minimums,) * len(classes)
+    minimums = tuple(minimums)
+    if len(minimums) != len(classes) or min(minimums) < 0:
+        raise ValueError("need one non-negative minimum per character class")
+    if sum(minimums) > length:
+        raise ValueError(f"length {length} is shorter than the required characters ({sum(minimums)})")
+    return minimums
+
+
+def generate_password(length=16, classes=None, minimums=None, rng=None):
+    """Generate a password containing at least minimums[i] characters of classes[i]
+
+    minimums may be one int for every class; by default each class appears
+    at least once. rng is an entropy_pool.EntropyPool and defaults to the
+    process-wide pool.
+    """
+    rng = rng or entropy_pool.get_default_pool()
+    alphabet, required, bounds = _plan(length, classes, minimums)
+    chars = bytearray(rng.choice_bytes(alphabet, length))
+    if required:
+        # Same distribution as drawing the required characters and the fill
+        # separately and shuffling them together: the required characters
+        # land on a uniformly random set of distinct positions (a partial
+        # Fisher-Yates over the positions).
+        values = rng.randbelow_each(bounds)
+        count = len(required)
+        positions = list(range(length))
+        for i, class_bytes in enumerate(required):
+            j = i + values[i]
+            positions[i], positions[j] = positions[j], positions[i]
+            chars[positions[i]] = class_bytes[values[count + i]]
+    return chars.decode('ascii')
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_plan(length, classes, minimums):
+    minimums = _minimums(classes, minimums, length)
+    alphabet = ''.join(classes)
+    if not alphabet.isascii() or len(alphabet) > 256:
+        raise ValueError("character classes must be ASCII, at most 256 characters in total")
+    required = tuple(chars.encode('ascii') for chars, count in zip(classes, minimums)
+                     for _ in range(count))
+    bounds = [length - i for i in range(len(required))] + [len(chars) for chars in required]
+    return alphabet, required, bounds
+
+
+def _plan(length, classes, minimums):
+    """(alphabet, required class per slot, randbelow bounds) for one set of constraints"""
+    if classes is None:
+        classes = character_classes()
+    elif not isinstance(classes, tuple):
+        classes = tuple(classes)
+    if minimums is not None and not isinstance(minimums, int):
+        minimums = tuple(minimums)
+    return _cached_plan(length, classes, minimums)
+
+
+def _log2_comb(n, k):
+    return (math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)) / math.log(2)
+
+
+def password_entropy(length, classes=None, minimums=None):
+    """Exact Shannon entropy, in bits, of generate_password's output distribution
+
+    With required characters the output is not uniform: a password with c
+    characters of class i can be produced by C(c, m) placements of its m
+    required ones. Its probability depends only on those counts, and each
+    count is m plus a binomial share of the free positions, so the entropy is
+    the unconstrained term minus E[log2 C(c_i, m_i)] summed per class.
+    """
+    classes = character_classes() if classes is None else classes
+    minimums = _minimums(classes, minimums, length)
+    sizes = [len(chars) for chars in classes]
+    alphabet = sum(sizes)
+    free = length - sum(minimums)
+
+    # log2 of the number of equally likely (placement, required, fill) outcomes
+    bits = (math.lgamma(length + 1) - math.lgamma(free + 1)
+            - sum(math.lgamma(m + 1) for m in minimums)) / math.log(2)
+    bits += sum(m * math.log2(size) for m, size in zip(minimums, sizes))
+    bits += free * math.log2(alphabet)
+
+    for m, size in zip(minimums, sizes):
+        if m == 0:
+            continue
+        if size == alphabet:
+            bits -= _log2_comb(length, m)
+            continue
+        p = size / alphabet
+        for extra in range(free + 1):
+            log_prob = (_log2_comb(free, extra) + extra * math.log2(p)
+                        + (free - extra) * math.log2(1 - p))
+            bits -= 2 ** log_prob * _log2_comb(m + extra, m)
+    return bits
@@ -0,0 +1,372 @@
+"""Command-line tools for the password strength checker
+
+    python -m pwcheck audit passwords.txt --format jsonl -o report.jsonl -j 8
+    python -m pwcheck generate --accounts users.txt -o initial.csv -j 8
+
+The audit streams a newline-delimited password file in fixed-size chunks, so
+memory use does not grow with the input. With -j, chunks are spread over a
+process pool and written back in input order. generate writes a batch of
+unique passwords the same way, optionally one per account ID. Progress and
+throughput go to stderr.
+"""
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha1
+
+import batch_analysis
+import breach_filter
+import breach_index
+import bulk_generation
+import common_passwords
+from password_analysis import (
+    calculate_score_and_rating,
+    generate_improvement_feedback,
+    local_password_analysis,
+)
+from password_generator import character_classes
+
+REPORT_FIELDS = (
+    'line', 'length', 'uppercase', 'lowercase', 'digit', 'special',
+    'repeating', 'sequences', 'common', 'common_rank', 'guesses_log10', 'guess_score',
+    'score', 'rating', 'feedback',
+)
+
+# Only reported with --guesses; see audit_chunk
+GUESS_FIELDS = ('guesses_log10', 'guess_score')
+
+# CSV text of each shared feedback tuple, joined once per process
+_feedback_text = {}
+
+
+def read_chunks(stream, chunk_size):
+    """Yield lists of (line number, password) from a binary stream, skipping blank lines"""
+    chunk = []
+    for number, raw in enumerate(stream, 1):
+        password = raw.rstrip(b'\r\n').decode('utf-8', errors='replace')
+        if not password:
+            continue
+        chunk.append((number, password))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def offline_breach_count(password):
+    """Breach count from the local filter and index only (None without an index)"""
+    digest = sha1(password.encode('utf-8')).digest()
+    bloom = breach_filter.get_default_filter()
+    if bloom is not None and digest not in bloom:
+        return 0
+    index = breach_index.get_default_index()
+    return index.lookup(digest) if index is not None else None
+
+
+def audit_chunk(chunk, engine='auto', breach=False, include_password=False, guesses=False):
+    """Analyze, score and add feedback for one chunk; returns report rows in input order
+
+    The guess estimate runs per password in Python and costs far more than
+    the rest of the analysis, so it is opt-in; without it scores are not
+    capped by the estimate and may be higher than the web page shows.
+    """
+    passwords = [password for _, password in chunk]
+    if engine == 'numpy' or (engine == 'auto' and batch_analysis.numpy_available):
+        analysis = batch_analysis.analyze_batch(passwords, guesses)
+        scores, ratings, _ = batch_analysis.score_batch(analysis)
+        feedback = batch_analysis.feedback_batch(analysis, ratings)
+        results = zip(batch_analysis.iter_rows(analysis), scores.tolist(), ratings.tolist(), feedback)
+    else:
+        results = []
+        for password in passwords:
+            analysis = local_password_analysis(password, guesses)
+            score, rating, _ = calculate_score_and_rating(analysis)
+            results.append((analysis, score, rating, generate_improvement_feedback(analysis, rating)))
+
+    rows = []
+    for (number, password), (analysis, score, rating, feedback) in zip(chunk, results):
+        row = {field: analysis.get(field) for field in REPORT_FIELDS}
+        row['line'] = number
+        row['score'] = score
+        row['rating'] = rating
+        # Feedback tuples are shared between rows, not copied
+        row['feedback'] = feedback
+        if breach:
+            row['breach_count'] = offline_breach_count(password)
+        if include_password:
+            row['password'] = password
+        rows.append(row)
+    return rows
+
+
+def report_fields(breach=False, include_password=False, guesses=False):
+    fields = REPORT_FIELDS if guesses else tuple(f for f in REPORT_FIELDS if f not in GUESS_FIELDS)
+    return (fields + (('breach_count',) if breach else ())
+            + (('password',) if include_password else ()))
+
+
+def _joined_feedback(feedback):
+    text = _feedback_text.get(feedback)
+    if text is None:
+        text = _feedback_text[feedback] = '; '.join(feedback)
+    return text
+
+
+def format_rows(rows, fields, fmt):
+    """Render report rows as CSV (without header) or JSON Lines text"""
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([_joined_feedback(row[f]) if f == 'feedback' else row[f] for f in fields])
+        return buffer.getvalue()
+    return ''.join(json.dumps({f: row[f] for f in fields}, ensure_ascii=False) + '\n'
+                   for row in rows)
+
+
+def audit_and_format(chunk, fmt, engine='auto', breach=False, include_password=False,
+                     guesses=False):
+    """Worker entry point: audit one chunk and return (row count, report text)"""
+    rows = audit_chunk(chunk, engine, breach, include_password, guesses)
+    return len(rows), format_rows(rows, report_fields(breach, include_password, guesses), fmt)
+
+
+def _pool_context():
+    # Forked workers inherit the wordlist and memory-mapped breach files
+    # already loaded by the parent instead of receiving pickled copies.
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('fork' if 'fork' in methods else None)
+
+
+def iter_audit_blocks(chunks, fmt, engine='auto', breach=False, include_password=False,
+                      workers=1, guesses=False):
+    """Yield (row count, report text) per chunk, in input order"""
+    if workers <= 1:
+        for chunk in chunks:
+            yield audit_and_format(chunk, fmt, engine, breach, include_password, guesses)
+        return
+
+    common_passwords.get_default_list()
+    if guesses:
+        common_passwords.get_guess_dictionary()
+    if breach:
+        breach_filter.get_default_filter()
+        breach_index.get_default_index()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+        # A bounded window of in-flight chunks keeps memory flat and order intact
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(audit_and_format, chunk, fmt, engine, breach,
+                                       include_password, guesses))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class Progress:
+    """Periodic throughput report on stderr"""
+
+    def __init__(self, interval=2.0, stream=sys.stderr, label="Audited"):
+        self.interval = interval
+        self.stream = stream
+        self.label = label
+        self.start = self.last = time.monotonic()
+        self.count = 0
+
+    def update(self, n):
+        self.count += n
+        now = time.monotonic()
+        if now - self.last >= self.interval:
+            self.last = now
+            self.report(final=False)
+
+    def report(self, final=True):
+        elapsed = max(time.monotonic() - self.start, 1e-9)
+        label = self.label if final else "Progress:"
+        print(f"{label} {self.count:,} passwords in {elapsed:.1f}s ({self.count / elapsed:,.0f}/s)",
+              file=self.stream)
+
+
+def run_audit(stream, out, fmt='csv', chunk_size=10000, engine='auto',
+              include_password=False, progress=None, workers=1, breach=False, guesses=False):
+    """Stream passwords from a binary stream into a report; returns the password count"""
+    progress = progress or Progress()
+    if fmt == 'csv':
+        csv.writer(out).writerow(report_fields(breach, include_password, guesses))
+    chunks = read_chunks(stream, chunk_size)
+    blocks = iter_audit_blocks(chunks, fmt, engine, breach, include_password, workers, guesses)
+    for count, text in blocks:
+        out.write(text)
+        progress.update(count)
+    progress.report()
+    return progress.count
+
+
+def read_accounts(stream):
+    """Yield account IDs from a binary stream, one per non-blank line"""
+    for raw in stream:
+        account = raw.strip().decode('utf-8', errors='replace')
+        if account:
+            yield account
+
+
+def _count_lines(stream):
+    # Sizes the uniqueness filter; only possible for seekable files
+    if not stream.seekable():
+        return None
+    count = sum(1 for _ in stream)
+    stream.seek(0)
+    return count
+
+
+def run_generate(out, count=None, accounts=None, fmt='csv', length=16, classes=None,
+                 minimums=None, workers=1, chunk_size=10000, unique='auto', progress=None,
+                 expected=None):
+    """Write count unique passwords, or one per account ID; returns the number written"""
+    progress = progress or Progress(label="Generated")
+    fields = ('password',) if accounts is None else ('account_id', 'password')
+    passwords = bulk_generation.iter_unique_passwords(
+        count if accounts is None else None, length, classes, minimums, workers, chunk_size,
+        unique, expected)
+    rows = ((password,) for password in passwords) if accounts is None else zip(accounts, passwords)
+    if fmt == 'csv':
+        csv.writer(out).writerow(fields)
+    block = []
+    for row in rows:
+        block.append(row)
+        if len(block) >= chunk_size:
+            _write_generated(out, fields, block, fmt)
+            progress.update(len(block))
+            block = []
+    if block:
+        _write_generated(out, fields, block, fmt)
+        progress.update(len(block))
+    passwords.close()
+    progress.report()
+    return progress.count
+
+
+def _write_generated(out, fields, rows, fmt):
+    if fmt == 'csv':
+        csv.writer(out).writerows(rows)
+    elif fmt == 'jsonl':
+        out.write(''.join(json.dumps(dict(zip(fields, row)), ensure_ascii=False) + '\n'
+                          for row in rows))
+    else:
+        out.write(''.join('\t'.join(row) + '\n' for row in rows))
+
+
+def _open_input(path):
+    return sys.stdin.buffer if path == '-' else open(path, 'rb')
+
+
+def _open_output(path):
+    if path in (None, '-'):
+        return sys.stdout
+    return open(path, 'w', encoding='utf-8', newline='')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m pwcheck", description=__doc__.split("\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    audit = commands.add_parser("audit", help="analyze a newline-delimited password file")
+    audit.add_argument("file", help="password file, or - for stdin")
+    audit.add_argument("-o", "--output", help="report file (default: stdout)")
+    audit.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    audit.add_argument("--chunk-size", type=int, default=10000)
+    audit.add_argument("--engine", choices=("auto", "numpy", "python"), default="auto")
+    audit.add_argument("--include-password", action="store_true",
+                       help="copy the plaintext password into each report row")
+    audit.add_argument("--breach", action="store_true",
+                       help="add breach counts from the offline index (PWNED_INDEX_PATH)")
+    audit.add_argument("-j", "--workers", type=int, default=1,
+                       help="worker processes (default: 1, run in-process)")
+    audit.add_argument("--guesses", action="store_true",
+                       help="add the guess estimate and cap scores by it, as the web page "
+                            "does (10-30x slower)")
+
+    generate = commands.add_parser("generate", help="write a batch of unique random passwords")
+    generate.add_argument("count", type=int, nargs="?", help="number of passwords")
+    generate.add_argument("--accounts", help="file of account IDs, one per line (or - for stdin); "
+                                             "writes one password per account")
+    generate.add_argument("-o", "--output", help="output file (default: stdout)")
+    generate.add_argument("--format", choices=("csv", "jsonl", "text"), default="csv")
+    generate.add_argument("--length", type=int, default=16)
+    generate.add_argument("--no-upper", dest="upper", action="store_false")
+    generate.add_argument("--no-lower", dest="lower", action="store_false")
+    generate.add_argument("--no-numbers", dest="numbers", action="store_false")
+    generate.add_argument("--no-special", dest="special", action="store_false")
+    generate.add_argument("--exclude-ambiguous", action="store_true",
+                          help="leave out easily confused characters (I, l, 1, O, 0, o)")
+    generate.add_argument("--min-per-class", type=int, default=1)
+    generate.add_argument("--unique", choices=("auto", "hash", "bloom"), default="auto",
+                          help="uniqueness check: exact hash set, or a Bloom filter "
+                               f"(auto: Bloom above {bulk_generation.BLOOM_THRESHOLD:,})")
+    generate.add_argument("--chunk-size", type=int, default=10000)
+    generate.add_argument("-j", "--workers", type=int, default=1,
+                          help="worker processes (default: 1, run in-process)")
+
+    args = parser.parse_args(argv)
+    if args.command == "generate":
+        return _main_generate(parser, args)
+    source = _open_input(args.file)
+    out = _open_output(args.output)
+    try:
+        if args.breach and breach_index.get_default_index() is None:
+            parser.error(f"--breach needs an offline index at {breach_index.INDEX_PATH}")
+        run_audit(source, out, args.format, args.chunk_size, args.engine, args.include_password,
+                  workers=args.workers, breach=args.breach, guesses=args.guesses)
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def _main_generate(parser, args):
+    if (args.count is None) == (args.accounts is None):
+        parser.error("generate needs either a count or --accounts")
+    classes = character_classes(args.upper, args.lower, args.numbers, args.special,
+                                args.exclude_ambiguous)
+    try:
+        bulk_generation.generate_block(1, args.length, classes, args.min_per_class)
+    except ValueError as e:
+        parser.error(str(e))
+    accounts_file = None if args.accounts is None else _open_input(args.accounts)
+    out = _open_output(args.output)
+    try:
+        expected = args.count
+        accounts = None
+        if accounts_file is not None:
+            expected = _count_lines(accounts_file)
+            accounts = read_accounts(accounts_file)
+        if args.unique == "bloom" and not expected:
+            parser.error("--unique bloom needs a count or a seekable --accounts file")
+        try:
+            run_generate(out, args.count, accounts, args.format, args.length, classes,
+                         args.min_per_class, args.workers, args.chunk_size, args.unique,
+                         expected=expected)
+        except ValueError as e:
+            # The batch cannot be unique: refused before writing, or the
+            # constraints ran out partway through an unsized account list
+            parser.error(str(e))
+    finally:
+        if accounts_file is not None and accounts_file is not sys.stdin.buffer:
+            accounts_file.close()
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""Declarative scoring policy compiled into a lookup table
+
+The policy (length points, per-feature points, the common-password override,
+score bounds, guess-score caps and rating bands) is read from a JSON or TOML
+file and compiled once into a flat table with one (score, rating, color)
+entry per length bucket, guess score and feature bitmask. Scoring a password
+is then a single indexed read, and the batch scorer indexes NumPy copies of
+the same table. The file is re-read when it changes on disk, so edits take
+effect without restarting the server.
+"""
+import os
+import threading
+import time
+from bisect import bisect_right
+
+# Policy file; defaults to the scoring_policy.json shipped next to this module
+POLICY_PATH = os.environ.get(
+    "SCORING_POLICY_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "scoring_policy.json"))
+
+# Seconds between checks of the policy file's modification time
+RELOAD_INTERVAL = float(os.environ.get("SCORING_POLICY_RELOAD_INTERVAL", "1"))
+
+# Bit i of the feature mask is set when analysis[FEATURES[i]] is true
+FEATURES = ('uppercase', 'lowercase', 'digit', 'special', 'repeating', 'sequences', 'common')
+
+DEFAULT_POLICY = {
+    'length_points': [
+        {'min_length': 0, 'points': -1},
+        {'min_length': 6, 'points': 0},
+        {'min_length': 8, 'points': 2},
+        {'min_length': 12, 'points': 3},
+        {'min_length': 16, 'points': 4},
+    ],
+    'feature_points': {
+        'uppercase': 1, 'lowercase': 1, 'digit': 1, 'special': 2,
+        'repeating': -2, 'sequences': -3,
+    },
+    'common_score': 0,
+    'min_score': 0,
+    'max_score': 10,
+    'guess_score_caps': [2, 4, 7, 10, 10],
+    'ratings': [
+        {'min_score': 8, 'rating': 'Strong', 'color': '#2ecc71'},
+        {'min_score': 5, 'rating': 'Moderate', 'color': '#f1c40f'},
+        {'min_score': 0, 'rating': 'Weak', 'color': '#e74c3c'},
+    ],
+}
+
+_policy = None
+_policy_mtime = None
+_next_check = 0.0
+_lock = threading.Lock()
+_versions = 0
+
+
+def feature_mask(analysis):
+    """Bitmask of the FEATURES set in an analysis dict"""
+    mask = 0
+    for bit, name in enumerate(FEATURES):
+        if analysis[name]:
+            mask |= 1 << bit
+    return mask
+
+
+class ScoringPolicy:
+    """A compiled scoring policy; score() is one table read per password"""
+
+    def __init__(self, policy):
+        global _versions
+        try:
+            lengths = sorted((int(b['min_length']), int(b['points'])) for b in policy['length_points'])
+            features = {name: int(points) for name, points in policy['feature_points'].items()}
+            common_score = policy.get('common_score')
+            common_score = None if common_score is None else int(common_score)
+            low, high = int(policy['min_score']), int(policy['max_score'])
+            caps = [int(cap) for cap in policy.get('guess_score_caps', ())]
+            bands = sorted(((int(r['min_score']), r['rating'], r['color']) for r in policy['ratings']),
+                           reverse=True)
+        except (KeyError, TypeError, AttributeError) as e:
+            # Wrong shapes (a list where a table belongs, ...) are invalid policies too
+            raise ValueError(f"invalid scoring policy: {e!r}") from None
+        unknown = set(features) - set(FEATURES)
+        if unknown:
+            raise ValueError(f"unknown features in scoring policy: {', '.join(sorted(unknown))}")
+        if not lengths or lengths[0][0] != 0:
+            raise ValueError("length_points must start at min_length 0")
+        if not bands or bands[-1][0] > low:
+            raise ValueError("ratings must cover the minimum score")
+
+        self.length_bounds = [min_length for min_length, _ in lengths]
+        self.guess_score_caps = tuple(caps)
+        self.ratings = tuple(rating for _, rating, _ in reversed(bands))
+        self.colors = tuple(color for _, _, color in reversed(bands))
+        # The last guess row is for analyses without a guess estimate
+        self.guess_rows = len(caps) + 1
+        self.table = []
+        self.levels = []
+        # True where the guess-score cap lowered the score
+        self.capped = []
+        for _, length_points in lengths:
+            for guess in range(self.guess_rows):
+                for mask in range(1 << len(FEATURES)):
+                    score = length_points + sum(points for name, points in features.items()
+                                                if mask & (1 << FEATURES.index(name)))
+                    if mask & (1 << FEATURES.index('common')) and common_score is not None:
+                        score = common_score
+                    score = max(min(score, high), low)
+                    capped = guess < len(caps) and caps[guess] < score
+                    if capped:
+                        score = caps[guess]
+                    level = next(len(bands) - 1 - i for i, band in enumerate(bands) if score >= band[0])
+                    self.table.append((score, self.ratings[level], self.colors[level]))
+                    self.levels.append(level)
+                    self.capped.append(capped)
+        self._arrays = None
+        _versions += 1
+        self.version = _versions
+
+    @classmethod
+    def from_file(cls, path):
+        """Load and compile a .json or .toml policy file"""
+        if path.endswith('.toml'):
+            try:
+                import tomllib
+            except ImportError:
+                raise ValueError("TOML scoring policies need Python 3.11+ (tomllib)") from None
+            with open(path, 'rb') as f:
+                return cls(tomllib.load(f))
+        import json
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def index(self, length, mask, guess_score=None):
+        """Table position for a length, feature mask and optional guess score"""
+        bucket = bisect_right(self.length_bounds, length) - 1
+        if guess_score is None or not self.guess_score_caps:
+            guess = self.guess_rows - 1
+        else:
+            guess = min(guess_score, self.guess_rows - 2)
+        return ((bucket * self.guess_rows + guess) << len(FEATURES)) | mask
+
+    def score(self, analysis):
+        """Return (score, rating, color) for an analysis dict"""
+        return self.table[self.index(analysis['length'], feature_mask(analysis),
+                                     analysis.get('guess_score'))]
+
+    def guess_capped(self, analysis):
+        """True if the guess-score cap lowered the score of an analysis dict"""
+        return self.capped[self.index(analysis['length'], feature_mask(analysis),
+                                      analysis.get('guess_score'))]
+
+    def arrays(self, np):
+        """NumPy (length bounds, scores, levels, ratings, colors, capped) for the batch scorer"""
+        if self._arrays is None:
+            self._arrays = (
+                np.array(self.length_bounds, dtype=np.int64),
+                np.array([score for score, _, _ in self.table], dtype=np.int64),
+                np.array(self.levels, dtype=np.int8),
+                np.array(self.ratings),
+                np.array(self.colors),
+                np.array(self.capped, dtype=bool),
+            )
+        return self._arrays
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_policy():
+    """Return the current policy, reloading the file if it changed on disk
+
+    A file that fails to load on reload leaves the previous policy in place;
+    without a file the built-in DEFAULT_POLICY is used.
+    """
+    global _policy, _policy_mtime, _next_check
+    now = time.monotonic()
+    if _policy is not None and now < _next_check:
+        return _policy
+    with _lock:
+        _next_check = now + RELOAD_INTERVAL
+        mtime = _mtime(POLICY_PATH)
+        if _policy is not None and mtime == _policy_mtime:
+            return _policy
+        if mtime is None:
+            policy = ScoringPolicy(DEFAULT_POLICY)
+        elif _policy is None:
+            policy = ScoringPolicy.from_file(POLICY_PATH)
+        else:
+            try:
+                policy = ScoringPolicy.from_file(POLICY_PATH)
+            except (OSError, ValueError):
+                return _policy
+        _policy, _policy_mtime = policy, mtime
+        return _policy
+
+
+def reload():
+    """Force the policy file to be read again on the next get_policy()"""
+    global _policy_mtime, _next_check
+    with _lock:
+        _policy_mtime = _next_check = 0
+    return get_policy()
@@ -0,0 +1,162 @@
+"""Aho-Corasick matcher for character sequences and keyboard walks
+
+Every run of at least MIN_LENGTH consecutive keys along a keyboard row,
+column or numeric-pad line (QWERTY, AZERTY, QWERTZ and Dvorak), as well as
+alphabetic and numeric runs, is a pattern, forwards and reversed. The
+automaton is compiled once per process, on first use, and finds every
+occurrence in a single pass over the input.
+"""
+from collections import deque
+
+MIN_LENGTH = 4
+
+_default_matcher = None
+
+ALPHABET_LINES = (
+    "abcdefghijklmnopqrstuvwxyz",
+    "01234567890",
+)
+
+# Lines shorter than MIN_LENGTH yield no patterns, so short columns are only
+# listed joined into a longer column-walk line
+KEYBOARD_LINES = {
+    'qwerty': (
+        "`1234567890-=", "qwertyuiop[]\\", "asdfghjkl;'", "zxcvbnm,./",
+        "1qaz", "2wsx", "3edc", "4rfv", "5tgb", "6yhn", "7ujm", "8ik,", "9ol.", "0p;/",
+        "1qaz2wsx3edc4rfv5tgb6yhn7ujm8ik,9ol.0p;/",
+    ),
+    'azerty': (
+        "azertyuiop", "qsdfghjklm", "wxcvbn,;:!",
+        "aqwzsxedcrfvtgbyhnuj,ik;ol:pm!",
+    ),
+    'qwertz': (
+        "qwertzuiop", "asdfghjkl", "yxcvbnm,.-",
+    ),
+    'dvorak': (
+        "',.pyfgcrl/=", "aoeuidhtns-", ";qjkxbmwvz",
+    ),
+    'numpad': (
+        "7410", "8520", "789456123", "147258369", "159357",
+    ),
+}
+
+
+def _walk_lines():
+    lines = list(ALPHABET_LINES)
+    for layout in KEYBOARD_LINES.values():
+        lines.extend(layout)
+    return lines
+
+
+def build_patterns(lines=None, min_length=MIN_LENGTH):
+    """Return every substring of at least min_length of each line, in both directions"""
+    patterns = set()
+    for line in _walk_lines() if lines is None else lines:
+        for text in (line, line[::-1]):
+            for start in range(len(text)):
+                for end in range(start + min_length, len(text) + 1):
+                    patterns.add(text[start:end])
+    return sorted(patterns)
+
+
+class SequenceMatcher:
+    """Aho-Corasick automaton compiled into a full transition table"""
+
+    def __init__(self, patterns):
+        self.patterns = tuple(patterns)
+        goto = [{}]
+        longest = [0]
+        for pattern in self.patterns:
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    longest.append(0)
+                node = nxt
+            longest[node] = max(longest[node], len(pattern))
+
+        # Breadth-first pass: fill failure transitions so each state has a
+        # direct edge for every alphabet symbol (a DFA), and propagate the
+        # longest pattern ending at each state along its failure link.
+        alphabet = {ch for pattern in self.patterns for ch in pattern}
+        fail = [0] * len(goto)
+        delta = [dict() for _ in goto]
+        queue = deque()
+        for ch in alphabet:
+            nxt = goto[0].get(ch, 0)
+            delta[0][ch] = nxt
+            if nxt:
+                queue.append(nxt)
+        while queue:
+            node = queue.popleft()
+            longest[node] = max(longest[node], longest[fail[node]])
+            for ch in alphabet:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    delta[node][ch] = delta[fail[node]][ch]
+                else:
+                    fail[nxt] = delta[fail[node]][ch]
+                    delta[node][ch] = nxt
+                    queue.append(nxt)
+        self._delta = delta
+        self._longest = longest
+
+    @property
+    def state_count(self):
+        return len(self._delta)
+
+    def step(self, state, ch):
+        """Advance the automaton by one character; returns (state, longest match ending here)"""
+        state = self._delta[state].get(ch, 0)
+        return state, self._longest[state]
+
+    def find_spans(self, text):
+        """Return merged (start, end) spans covered by any pattern occurrence"""
+        spans = []
+        delta, longest = self._delta, self._longest
+        state = 0
+        for i, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            length = longest[state]
+            if length:
+                start, end = i + 1 - length, i + 1
+                if spans and start <= spans[-1][1]:
+                    spans[-1] = (min(spans[-1][0], start), end)
+                else:
+                    spans.append((start, end))
+        return spans
+
+    def search(self, text):
+        """Return True if text contains any pattern"""
+        delta, longest = self._delta, self._longest
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if longest[state]:
+                return True
+        return False
+
+
+def get_default_matcher():
+    """Return the process-wide matcher, compiling it on first use"""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = SequenceMatcher(build_patterns())
+    return _default_matcher
+
+
+def find_sequences(text):
+    """Spans of predictable sequences in already-lowercased text"""
+    return get_default_matcher().find_spans(text)
+
+
+def min_length_windows():
+    """Every pattern of exactly MIN_LENGTH characters
+
+    A text contains some pattern iff one of its MIN_LENGTH-character windows
+    is in this set, because every longer pattern starts with one of them.
+    """
+    return [p for p in get_default_matcher().patterns if len(p) == MIN_LENGTH]